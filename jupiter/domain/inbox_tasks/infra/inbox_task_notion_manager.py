@@ -1,6 +1,6 @@
 """A manager of Notion-side inbox tasks."""
 import abc
-from typing import Iterable
+from typing import Dict, Iterable, List
 
 from jupiter.domain.inbox_tasks.notion_inbox_task import NotionInboxTask
 from jupiter.domain.inbox_tasks.notion_inbox_task_collection import (
@@ -37,3 +37,21 @@ class InboxTaskNotionManager(
         self, ref_id: EntityId, big_plans_labels: Iterable[NotionFieldLabel]
     ) -> None:
         """Upsert the Notion-side structure for the 'big plan' select field."""
+
+    @abc.abstractmethod
+    def load_leaves(
+        self, trunk_ref_id: EntityId, leaf_ref_ids: Iterable[EntityId]
+    ) -> Dict[EntityId, NotionInboxTask]:
+        """Load a batch of Notion-side inbox tasks by id, leaving out the missing ones."""
+
+    @abc.abstractmethod
+    def save_leaves(
+        self, trunk_ref_id: EntityId, leaves: Iterable[NotionInboxTask]
+    ) -> List[NotionInboxTask]:
+        """Update a batch of Notion-side inbox tasks with new data."""
+
+    @abc.abstractmethod
+    def remove_leaves(
+        self, trunk_ref_id: EntityId, leaf_ref_ids: Iterable[EntityId]
+    ) -> List[EntityId]:
+        """Hard remove a batch of Notion-side inbox tasks, returning the missing ids."""
@@ -15,6 +15,10 @@ class InboxTaskNotFoundError(LeafEntityNotFoundError):
 class InboxTaskRepository(LeafEntityRepository[InboxTask], abc.ABC):
     """A repository of inbox tasks."""
 
+    @abc.abstractmethod
+    def save_many(self, entities: Iterable[InboxTask]) -> List[InboxTask]:
+        """Save a batch of inbox tasks."""
+
     @abc.abstractmethod
     def find_all_with_filters(
         self,
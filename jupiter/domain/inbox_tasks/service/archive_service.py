@@ -1,6 +1,6 @@
 """Shared service for archiving an inbox task."""
 import logging
-from typing import Final
+from typing import Dict, Final, Iterable, List
 
 from jupiter.domain.inbox_tasks.inbox_task import InboxTask
 from jupiter.domain.inbox_tasks.infra.inbox_task_notion_manager import (
@@ -8,6 +8,7 @@ from jupiter.domain.inbox_tasks.infra.inbox_task_notion_manager import (
     NotionInboxTaskNotFoundError,
 )
 from jupiter.domain.storage_engine import DomainStorageEngine
+from jupiter.framework.base.entity_id import EntityId
 from jupiter.framework.event import EventSource
 from jupiter.framework.use_case import ProgressReporter, MarkProgressStatus
 from jupiter.utils.time_provider import TimeProvider
@@ -63,3 +64,55 @@ class InboxTaskArchiveService:
                     "Skipping archiving of Notion inbox task because it could not be found"
                 )
                 entity_reporter.mark_remote_change(MarkProgressStatus.FAILED)
+
+    def do_it_bulk(
+        self, progress_reporter: ProgressReporter, inbox_tasks: Iterable[InboxTask]
+    ) -> None:
+        """Execute the service's action for a batch of inbox tasks at once."""
+        now = self._time_provider.get_current_time()
+        archived_inbox_tasks = [
+            inbox_task.mark_archived(self._source, now)
+            for inbox_task in inbox_tasks
+            if not inbox_task.archived
+        ]
+
+        if len(archived_inbox_tasks) == 0:
+            return
+
+        with self._storage_engine.get_unit_of_work() as uow:
+            uow.inbox_task_repository.save_many(archived_inbox_tasks)
+
+        # Apply Notion changes. Every task gets its progress line even if this
+        # fails, since the local archive has already been saved.
+        ref_ids_by_collection_ref_id: Dict[EntityId, List[EntityId]] = {}
+        for inbox_task in archived_inbox_tasks:
+            ref_ids_by_collection_ref_id.setdefault(
+                inbox_task.inbox_task_collection_ref_id, []
+            ).append(inbox_task.ref_id)
+        remote_statuses: Dict[EntityId, MarkProgressStatus] = {}
+        try:
+            for collection_ref_id, ref_ids in ref_ids_by_collection_ref_id.items():
+                not_found_ref_ids = set(
+                    self._inbox_task_notion_manager.remove_leaves(
+                        collection_ref_id, ref_ids
+                    )
+                )
+                for ref_id in ref_ids:
+                    if ref_id in not_found_ref_ids:
+                        LOGGER.info(
+                            "Skipping archiving of Notion inbox task because it could not be found"
+                        )
+                        remote_statuses[ref_id] = MarkProgressStatus.FAILED
+                    else:
+                        remote_statuses[ref_id] = MarkProgressStatus.OK
+        finally:
+            for inbox_task in archived_inbox_tasks:
+                with progress_reporter.start_archiving_entity(
+                    "inbox task", inbox_task.ref_id, str(inbox_task.name)
+                ) as entity_reporter:
+                    entity_reporter.mark_local_change()
+                    entity_reporter.mark_remote_change(
+                        remote_statuses.get(
+                            inbox_task.ref_id, MarkProgressStatus.FAILED
+                        )
+                    )
@@ -0,0 +1,85 @@
+"""Shared service for pushing a batch of already saved inbox tasks to Notion."""
+import logging
+from typing import Dict, Final, List
+
+from jupiter.domain.inbox_tasks.inbox_task import InboxTask
+from jupiter.domain.inbox_tasks.infra.inbox_task_notion_manager import (
+    InboxTaskNotionManager,
+)
+from jupiter.domain.inbox_tasks.notion_inbox_task import NotionInboxTask
+from jupiter.framework.base.entity_id import EntityId
+from jupiter.framework.use_case import ProgressReporter, MarkProgressStatus
+
+LOGGER = logging.getLogger(__name__)
+
+
+class InboxTaskNotionBatchSaveService:
+    """Shared service for pushing a batch of already saved inbox tasks to Notion."""
+
+    _inbox_task_notion_manager: Final[InboxTaskNotionManager]
+
+    def __init__(self, inbox_task_notion_manager: InboxTaskNotionManager) -> None:
+        """Constructor."""
+        self._inbox_task_notion_manager = inbox_task_notion_manager
+
+    def do_it(
+        self,
+        progress_reporter: ProgressReporter,
+        inbox_task_collection_ref_id: EntityId,
+        inbox_tasks: List[InboxTask],
+        direct_info: NotionInboxTask.DirectInfo,
+    ) -> None:
+        """Execute the service's action."""
+        non_archived_inbox_tasks = [it for it in inbox_tasks if not it.archived]
+
+        # Every task gets its progress line even if pushing to Notion fails, since
+        # the local changes have already been saved.
+        remote_statuses: Dict[EntityId, MarkProgressStatus] = {}
+        try:
+            if len(non_archived_inbox_tasks) > 0:
+                notion_inbox_tasks = self._inbox_task_notion_manager.load_leaves(
+                    inbox_task_collection_ref_id,
+                    [it.ref_id for it in non_archived_inbox_tasks],
+                )
+                changed_notion_inbox_tasks: List[NotionInboxTask] = []
+                changed_ref_ids: List[EntityId] = []
+                for inbox_task in non_archived_inbox_tasks:
+                    notion_inbox_task = notion_inbox_tasks.get(inbox_task.ref_id)
+                    if notion_inbox_task is None:
+                        LOGGER.info(
+                            "Skipping update of Notion inbox task because it could not be found"
+                        )
+                        remote_statuses[inbox_task.ref_id] = MarkProgressStatus.FAILED
+                        continue
+                    new_notion_inbox_task = notion_inbox_task.join_with_entity(
+                        inbox_task, direct_info
+                    )
+                    # Rows whose Notion-side content doesn't change aren't rewritten.
+                    if new_notion_inbox_task.has_same_content_as(notion_inbox_task):
+                        remote_statuses[
+                            inbox_task.ref_id
+                        ] = MarkProgressStatus.NOT_NEEDED
+                    else:
+                        changed_notion_inbox_tasks.append(new_notion_inbox_task)
+                        changed_ref_ids.append(inbox_task.ref_id)
+                self._inbox_task_notion_manager.save_leaves(
+                    inbox_task_collection_ref_id, changed_notion_inbox_tasks
+                )
+                for ref_id in changed_ref_ids:
+                    remote_statuses[ref_id] = MarkProgressStatus.OK
+        finally:
+            for inbox_task in inbox_tasks:
+                with progress_reporter.start_updating_entity(
+                    "inbox task", inbox_task.ref_id, str(inbox_task.name)
+                ) as entity_reporter:
+                    entity_reporter.mark_local_change()
+                    if inbox_task.archived:
+                        entity_reporter.mark_remote_change(
+                            MarkProgressStatus.NOT_NEEDED
+                        )
+                    else:
+                        entity_reporter.mark_remote_change(
+                            remote_statuses.get(
+                                inbox_task.ref_id, MarkProgressStatus.FAILED
+                            )
+                        )
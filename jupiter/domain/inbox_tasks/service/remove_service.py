@@ -8,6 +8,7 @@ from jupiter.domain.inbox_tasks.infra.inbox_task_notion_manager import (
     NotionInboxTaskNotFoundError,
 )
 from jupiter.domain.storage_engine import DomainStorageEngine
+from jupiter.framework.base.entity_id import EntityId
 from jupiter.framework.use_case import ProgressReporter, MarkProgressStatus
 
 LOGGER = logging.getLogger(__name__)
@@ -47,3 +48,26 @@ class InboxTaskRemoveService:
                     "Skipping archiving of Notion inbox task because it could not be found"
                 )
                 entity_reporter.mark_remote_change(MarkProgressStatus.FAILED)
+
+    def do_it_by_id(
+        self, progress_reporter: ProgressReporter, ref_id: EntityId
+    ) -> None:
+        """Execute the service's action for a task given by id."""
+        with progress_reporter.start_removing_entity(
+            "inbox task", ref_id
+        ) as entity_reporter:
+            with self._storage_engine.get_unit_of_work() as uow:
+                inbox_task = uow.inbox_task_repository.remove(ref_id)
+                entity_reporter.mark_known_name(str(inbox_task.name))
+                entity_reporter.mark_local_change()
+
+            try:
+                self._inbox_task_notion_manager.remove_leaf(
+                    inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
+                )
+                entity_reporter.mark_remote_change()
+            except NotionInboxTaskNotFoundError:
+                LOGGER.info(
+                    "Skipping removal of Notion inbox task because it could not be found"
+                )
+                entity_reporter.mark_remote_change(MarkProgressStatus.FAILED)
@@ -1,8 +1,12 @@
 """A manager of Notion-side metrics."""
+import abc
+from typing import Iterable, List
+
 from jupiter.domain.metrics.notion_metric import NotionMetric
 from jupiter.domain.metrics.notion_metric_collection import NotionMetricCollection
 from jupiter.domain.metrics.notion_metric_entry import NotionMetricEntry
 from jupiter.domain.workspaces.notion_workspace import NotionWorkspace
+from jupiter.framework.base.entity_id import EntityId
 from jupiter.framework.notion_manager import (
     NotionBranchEntityNotFoundError,
     NotionLeafEntityNotFoundError,
@@ -24,3 +28,12 @@ class MetricNotionManager(
     ]
 ):
     """A manager of Notion-side metrics."""
+
+    @abc.abstractmethod
+    def remove_leaves(
+        self,
+        trunk_ref_id: EntityId,
+        branch_ref_id: EntityId,
+        leaf_ref_ids: Iterable[EntityId],
+    ) -> List[EntityId]:
+        """Hard remove a batch of Notion-side metric entries, returning missing ids."""
@@ -48,6 +48,8 @@ class SlackTaskArchiveService:
         if slack_task.archived:
             return
 
+        now = self._time_provider.get_current_time()
+
         with self._storage_engine.get_unit_of_work() as uow:
             slack_task_collection = uow.slack_task_collection_repository.load_by_id(
                 slack_task.slack_task_collection_ref_id
@@ -65,16 +67,21 @@ class SlackTaskArchiveService:
                 filter_slack_task_ref_ids=[slack_task.ref_id],
             )
 
-        for inbox_task in inbox_tasks_to_archive:
+            # All the local changes happen in the one transaction.
+            archived_inbox_tasks = [
+                inbox_task.mark_archived(self._source, now)
+                for inbox_task in inbox_tasks_to_archive
+            ]
+            uow.inbox_task_repository.save_many(archived_inbox_tasks)
+
+            slack_task = slack_task.mark_archived(self._source, now)
+            uow.slack_task_repository.save(slack_task)
+
+        for inbox_task in archived_inbox_tasks:
             with progress_reporter.start_archiving_entity(
                 "inbox task", inbox_task.ref_id, str(inbox_task.name)
             ) as entity_reporter:
-                with self._storage_engine.get_unit_of_work() as uow:
-                    inbox_task = inbox_task.mark_archived(
-                        self._source, self._time_provider.get_current_time()
-                    )
-                    uow.inbox_task_repository.save(inbox_task)
-                    entity_reporter.mark_local_change()
+                entity_reporter.mark_local_change()
 
                 try:
                     self._inbox_task_notion_manager.remove_leaf(
@@ -91,12 +98,7 @@ class SlackTaskArchiveService:
         with progress_reporter.start_archiving_entity(
             "Slack task", slack_task.ref_id, str(slack_task.simple_name)
         ) as entity_reporter:
-            with self._storage_engine.get_unit_of_work() as uow:
-                slack_task = slack_task.mark_archived(
-                    self._source, self._time_provider.get_current_time()
-                )
-                uow.slack_task_repository.save(slack_task)
-                entity_reporter.mark_local_change()
+            entity_reporter.mark_local_change()
 
             try:
                 self._slack_task_notion_manager.remove_leaf(
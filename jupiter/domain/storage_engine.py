@@ -248,3 +248,8 @@ class DomainStorageEngine(abc.ABC):
     @contextmanager
     def get_unit_of_work(self) -> Iterator[DomainUnitOfWork]:
         """Build a unit of work."""
+
+    @abc.abstractmethod
+    @contextmanager
+    def get_read_only_unit_of_work(self) -> Iterator[DomainUnitOfWork]:
+        """Build a unit of work which can only be used for reading."""
@@ -179,6 +179,14 @@ class NotionLeafEntity(
             ),
         )
 
+    def has_same_content_as(
+        self: _NotionLeafEntitySubclassT, other: _NotionLeafEntitySubclassT
+    ) -> bool:
+        """Whether this Notion row holds the same data as another one."""
+        return (
+            dataclasses.replace(self, last_edited_time=other.last_edited_time) == other
+        )
+
     def new_entity(
         self, parent_ref_id: EntityId, extra_info: NotionLeafEntityInverseInfoT
     ) -> LeafEntityT:
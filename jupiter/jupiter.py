@@ -893,6 +893,7 @@ def main() -> None:
         ),
         PersonChangeCatchUpProject(
             PersonChangeCatchUpProjectUseCase(
+                global_properties,
                 time_provider,
                 invocation_recorder,
                 domain_storage_engine,
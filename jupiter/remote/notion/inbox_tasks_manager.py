@@ -2,7 +2,7 @@
 import copy
 import hashlib
 import uuid
-from typing import Final, ClassVar, cast, Dict, Optional, Iterable
+from typing import Final, ClassVar, cast, Dict, Optional, Iterable, List
 
 from jupiter.domain.difficulty import Difficulty
 from jupiter.domain.eisen import Eisen
@@ -1146,6 +1146,33 @@ class NotionInboxTasksManager(InboxTaskNotionManager):
                 f"Notion inbox task with id {leaf.ref_id} was not found"
             ) from err
 
+    def save_leaves(
+        self, trunk_ref_id: EntityId, leaves: Iterable[NotionInboxTask]
+    ) -> List[NotionInboxTask]:
+        """Update a batch of Notion-side inbox tasks with new data."""
+        try:
+            links = self._collections_manager.save_collection_items(
+                timezone=self._global_properties.timezone,
+                schema=self._SCHEMA,
+                collection_key=NotionLockKey(f"{self._KEY}:{trunk_ref_id}"),
+                items=[
+                    (
+                        NotionLockKey(f"{leaf.ref_id}"),
+                        leaf,
+                        NotionTextBlock(notion_id=BAD_NOTION_ID, text=leaf.notes)
+                        if leaf.notes
+                        else None,
+                    )
+                    for leaf in leaves
+                ],
+                no_properties_fields=["notes"],
+            )
+            return [link.item_info for link in links]
+        except NotionCollectionItemNotFoundError as err:
+            raise NotionInboxTaskNotFoundError(
+                "Some Notion inbox tasks in the batch were not found"
+            ) from err
+
     def load_all_leaves(self, trunk_ref_id: EntityId) -> Iterable[NotionInboxTask]:
         """Retrieve all the Notion-side inbox tasks."""
         return [
@@ -1178,6 +1205,27 @@ class NotionInboxTasksManager(InboxTaskNotionManager):
                 f"Notion inbox task with id {leaf_ref_id} was not found"
             ) from err
 
+    def load_leaves(
+        self, trunk_ref_id: EntityId, leaf_ref_ids: Iterable[EntityId]
+    ) -> Dict[EntityId, NotionInboxTask]:
+        """Retrieve a batch of Notion-side inbox tasks by id, leaving out the missing ones."""
+        # Each distinct inbox task is fetched only once, however often it is asked for.
+        leaf_ref_ids_by_key = {
+            NotionLockKey(f"{leaf_ref_id}"): leaf_ref_id for leaf_ref_id in leaf_ref_ids
+        }
+        links_by_key = self._collections_manager.load_collection_items(
+            timezone=self._global_properties.timezone,
+            schema=self._SCHEMA,
+            ctor=NotionInboxTask,
+            keys=leaf_ref_ids_by_key.keys(),
+            collection_key=NotionLockKey(f"{self._KEY}:{trunk_ref_id}"),
+            no_properties_fields={"notes": None},
+        )
+        return {
+            leaf_ref_ids_by_key[key]: link.item_info
+            for key, link in links_by_key.items()
+        }
+
     def remove_leaf(
         self, trunk_ref_id: EntityId, leaf_ref_id: Optional[EntityId]
     ) -> None:
@@ -1192,6 +1240,19 @@ class NotionInboxTasksManager(InboxTaskNotionManager):
                 f"Notion inbox task with id {leaf_ref_id} was not found"
             ) from err
 
+    def remove_leaves(
+        self, trunk_ref_id: EntityId, leaf_ref_ids: Iterable[EntityId]
+    ) -> List[EntityId]:
+        """Hard remove a batch of Notion-side inbox tasks, returning the missing ids."""
+        leaf_ref_ids_by_key = {
+            NotionLockKey(f"{leaf_ref_id}"): leaf_ref_id for leaf_ref_id in leaf_ref_ids
+        }
+        missing_keys = self._collections_manager.remove_collection_items(
+            keys=leaf_ref_ids_by_key.keys(),
+            collection_key=NotionLockKey(f"{self._KEY}:{trunk_ref_id}"),
+        )
+        return [leaf_ref_ids_by_key[key] for key in missing_keys]
+
     def drop_all_leaves(self, trunk_ref_id: EntityId) -> None:
         """Remove all inbox tasks Notion-side."""
         self._collections_manager.drop_all_collection_items(
@@ -1,10 +1,24 @@
 """The handler of collections on Notion side."""
 import dataclasses
+import functools
 import hashlib
 import logging
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import TypeVar, Final, Dict, Iterable, cast, List, Tuple
+from typing import (
+    TypeVar,
+    Final,
+    Dict,
+    Iterable,
+    cast,
+    List,
+    Tuple,
+    Callable,
+    ClassVar,
+    Optional,
+    Union,
+)
 
 from jupiter.domain.adate import ADate
 from jupiter.domain.timezone import Timezone
@@ -20,6 +34,7 @@ from jupiter.remote.notion.infra.client import (
 )
 from jupiter.remote.notion.infra.client_builder import NotionClientBuilder
 from jupiter.remote.notion.infra.client_v2 import (
+    NotionClientV2,
     NotionCollectionItem,
     NotionBlock,
     NotionEntityNotFoundException,
@@ -67,11 +82,17 @@ class NotionCollectionItemNotFoundError(Exception):
 
 
 ItemT = TypeVar("ItemT", bound=NotionLeafEntity[typing.Any, typing.Any, typing.Any])
+_RequestT = TypeVar("_RequestT")
+_ResponseT = TypeVar("_ResponseT")
 
 
 class NotionCollectionsManager:
     """The handler for collections on Notion side."""
 
+    # Bound on the number of concurrent Notion calls in batch operations, to stay
+    # clear of rate limits.
+    _MAX_CONCURRENT_REQUESTS: ClassVar[int] = 8
+
     _time_provider: Final[TimeProvider]
     _client_builder: Final[NotionClientBuilder]
     _storage_engine: Final[NotionStorageEngine]
@@ -935,62 +956,92 @@ class NotionCollectionsManager:
         content_block: typing.Optional[NotionBlock] = None,
     ) -> NotionCollectionItemLinkExtra[ItemT]:
         """Update the Notion-side entity with new data."""
-        if row.ref_id is None or row.ref_id == BAD_REF_ID:
-            raise Exception("Can only save over an entity which has a ref_id")
+        return self.save_collection_items(
+            timezone=timezone,
+            schema=schema,
+            collection_key=collection_key,
+            items=[(key, row, content_block)],
+            no_properties_fields=no_properties_fields,
+        )[0]
+
+    def save_collection_items(
+        self,
+        timezone: Timezone,
+        schema: JSONDictType,
+        collection_key: NotionLockKey,
+        items: Iterable[Tuple[NotionLockKey, ItemT, typing.Optional[NotionBlock]]],
+        no_properties_fields: typing.Optional[Iterable[str]] = None,
+    ) -> List[NotionCollectionItemLinkExtra[ItemT]]:
+        """Update a batch of Notion-side entities with new data, in the given order."""
+        all_items = list(items)
+        all_keys = [key for (key, _, _) in all_items]
+        for _, row, _ in all_items:
+            if row.ref_id is None or row.ref_id == BAD_REF_ID:
+                raise Exception("Can only save over an entity which has a ref_id")
+        all_no_properties_fields = (
+            list(no_properties_fields) if no_properties_fields is not None else None
+        )
 
         try:
             with self._storage_engine.get_unit_of_work() as uow:
                 collection_link = uow.notion_collection_link_repository.load(
                     collection_key
                 )
-                item_key = self._build_compound_key(collection_key, key)
-                item_link = uow.notion_collection_item_link_repository.load(item_key)
-                block_links = (
+                item_keys = [
+                    self._build_compound_key(collection_key, key) for key in all_keys
+                ]
+                item_links = [
+                    uow.notion_collection_item_link_repository.load(item_key)
+                    for item_key in item_keys
+                ]
+                all_block_links = [
                     uow.notion_collection_item_block_link_repository.find_all_for_item(
                         item_key
                     )
-                )
-
-            client = self._client_builder.get_notion_client_v2()
-
-            collection_item = self._transform_leaf_into_collection_item(
-                timezone=timezone,
-                schema=schema,
-                notion_id=item_link.notion_id,
-                database_notion_id=collection_link.page_notion_id,
-                created_time=item_link.created_time,
-                item=row,
-                no_properties_fields=no_properties_fields,
-            )
+                    for item_key in item_keys
+                ]
+        except NotionCollectionItemLinkNotFoundError as err:
+            raise NotionCollectionItemNotFoundError(
+                f"Collection items with keys {all_keys} could not be found"
+            ) from err
 
-            client.update_collection_item(collection_item)
+        client = self._client_builder.get_notion_client_v2()
 
-            if len(block_links) == 1:
-                if content_block is None:
-                    client.remove_content_block(block_links[0].notion_id)
-                    new_content_block = None
-                else:
-                    if content_block.__class__.__name__ != block_links[0].the_type:
-                        client.remove_content_block(block_links[0].notion_id)
-                        new_content_block = client.create_content_block(
-                            item_link.notion_id, content_block
-                        )
-                    else:
-                        new_content_block = client.update_content_block(
-                            content_block.assign_notion_id(block_links[0].notion_id)
-                        )
-            elif content_block is not None:
-                new_content_block = client.create_content_block(
-                    item_link.notion_id, content_block
+        all_outcomes = self._map_concurrently(
+            lambda args: self._update_collection_item_on_notion(
+                client,
+                timezone,
+                schema,
+                collection_link,
+                all_no_properties_fields,
+                *args,
+            ),
+            [
+                (item_link, block_links, row, content_block)
+                for item_link, block_links, (_, row, content_block) in zip(
+                    item_links, all_block_links, all_items
                 )
-            else:
-                new_content_block = None
+            ],
+        )
 
-            with self._storage_engine.get_unit_of_work() as uow:
+        # The links of the items which did change on Notion are recorded even if
+        # others failed, so they keep pointing at what is actually there.
+        first_error: Optional[Exception] = None
+        new_item_links = []
+        with self._storage_engine.get_unit_of_work() as uow:
+            for item_key, item_link, block_links, outcome in zip(
+                item_keys, item_links, all_block_links, all_outcomes
+            ):
+                if isinstance(outcome, Exception):
+                    if first_error is None:
+                        first_error = outcome
+                    continue
+                new_content_block = outcome
                 new_item_link = item_link.mark_update(
                     self._time_provider.get_current_time()
                 )
                 uow.notion_collection_item_link_repository.save(new_item_link)
+                new_item_links.append(new_item_link)
 
                 if len(block_links) == 1:
                     if new_content_block is None:
@@ -1019,14 +1070,17 @@ class NotionCollectionsManager:
                         new_content_block_link
                     )
 
-            return new_item_link.with_extra(row)
-        except (
-            NotionCollectionItemLinkNotFoundError,
-            NotionEntityNotFoundException,
-        ) as err:
-            raise NotionCollectionFieldTagNotFoundError(
-                f"Collection field tag with key {key} could not be found"
-            ) from err
+        if isinstance(first_error, NotionEntityNotFoundException):
+            raise NotionCollectionItemNotFoundError(
+                f"Collection items with keys {all_keys} could not be found"
+            ) from first_error
+        elif first_error is not None:
+            raise first_error
+
+        return [
+            new_item_link.with_extra(row)
+            for new_item_link, (_, row, _) in zip(new_item_links, all_items)
+        ]
 
     def load_all_collection_items(
         self,
@@ -1105,6 +1159,50 @@ class NotionCollectionsManager:
                 f"Collection item with key {key} could not be found"
             ) from err
 
+    def load_collection_items(
+        self,
+        timezone: Timezone,
+        schema: JSONDictType,
+        ctor: typing.Type[ItemT],
+        keys: Iterable[NotionLockKey],
+        collection_key: NotionLockKey,
+        no_properties_fields: typing.Optional[Dict[str, typing.Any]] = None,
+    ) -> Dict[NotionLockKey, NotionCollectionItemLinkExtra[ItemT]]:
+        """Retrieve a batch of Notion-side entities by key, leaving out the missing ones."""
+        found_keys = []
+        found_item_links = []
+        with self._storage_engine.get_unit_of_work() as uow:
+            for key in keys:
+                item_key = self._build_compound_key(collection_key, key)
+                try:
+                    item_link = uow.notion_collection_item_link_repository.load(
+                        item_key
+                    )
+                except NotionCollectionItemLinkNotFoundError:
+                    continue
+                found_keys.append(key)
+                found_item_links.append(item_link)
+
+        client = self._client_builder.get_notion_client_v2()
+        all_outcomes = self._map_concurrently(
+            client.get_collection_item, [il.notion_id for il in found_item_links]
+        )
+
+        item_links_by_key: Dict[
+            NotionLockKey, NotionCollectionItemLinkExtra[ItemT]
+        ] = {}
+        for key, item_link, outcome in zip(found_keys, found_item_links, all_outcomes):
+            if isinstance(outcome, NotionEntityNotFoundException):
+                continue
+            elif isinstance(outcome, Exception):
+                raise outcome
+            item_links_by_key[key] = item_link.with_extra(
+                self._transform_collection_item_into_leaf(
+                    timezone, schema, ctor, outcome, no_properties_fields
+                )
+            )
+        return item_links_by_key
+
     def remove_collection_item(
         self, key: NotionLockKey, collection_key: NotionLockKey
     ) -> None:
@@ -1130,6 +1228,55 @@ class NotionCollectionsManager:
                 f"Collection item with key {key} could not be found"
             ) from err
 
+    def remove_collection_items(
+        self, keys: Iterable[NotionLockKey], collection_key: NotionLockKey
+    ) -> List[NotionLockKey]:
+        """Hard remove a batch of Notion-side entities, returning the missing keys."""
+        found_keys = []
+        found_item_links = []
+        missing_keys = []
+        with self._storage_engine.get_unit_of_work() as uow:
+            for key in keys:
+                item_key = self._build_compound_key(collection_key, key)
+                try:
+                    item_link = uow.notion_collection_item_link_repository.load(
+                        item_key
+                    )
+                except NotionCollectionItemLinkNotFoundError:
+                    missing_keys.append(key)
+                    continue
+                found_keys.append(key)
+                found_item_links.append(item_link)
+
+        client = self._client_builder.get_notion_client_v2()
+        all_outcomes = self._map_concurrently(
+            client.remove_collection_item, [il.notion_id for il in found_item_links]
+        )
+
+        # The links of the items which were removed from Notion are dropped even if
+        # others failed, so none is left pointing at a removed item.
+        first_error: Optional[Exception] = None
+        with self._storage_engine.get_unit_of_work() as uow:
+            for key, item_link, outcome in zip(
+                found_keys, found_item_links, all_outcomes
+            ):
+                if isinstance(outcome, NotionEntityNotFoundException):
+                    missing_keys.append(key)
+                    continue
+                elif isinstance(outcome, Exception):
+                    if first_error is None:
+                        first_error = outcome
+                    continue
+                uow.notion_collection_item_link_repository.remove(item_link.key)
+                uow.notion_collection_item_block_link_repository.remove_all_for_item(
+                    item_link.key
+                )
+
+        if first_error is not None:
+            raise first_error
+
+        return missing_keys
+
     def drop_all_collection_items(self, collection_key: NotionLockKey) -> None:
         """Hard remove all the Notion-side entities."""
         with self._storage_engine.get_unit_of_work() as uow:
@@ -1178,6 +1325,86 @@ class NotionCollectionsManager:
                 )
             ]
 
+    def _update_collection_item_on_notion(
+        self,
+        client: NotionClientV2,
+        timezone: Timezone,
+        schema: JSONDictType,
+        collection_link: NotionCollectionLink,
+        no_properties_fields: typing.Optional[Iterable[str]],
+        item_link: NotionCollectionItemLink,
+        block_links: List[NotionCollectionItemBlockLink],
+        row: ItemT,
+        content_block: typing.Optional[NotionBlock],
+    ) -> typing.Optional[NotionBlock]:
+        """Push an entity's new data to Notion, returning its new content block."""
+        collection_item = self._transform_leaf_into_collection_item(
+            timezone=timezone,
+            schema=schema,
+            notion_id=item_link.notion_id,
+            database_notion_id=collection_link.page_notion_id,
+            created_time=item_link.created_time,
+            item=row,
+            no_properties_fields=no_properties_fields,
+        )
+
+        client.update_collection_item(collection_item)
+
+        if len(block_links) == 1:
+            if content_block is None:
+                client.remove_content_block(block_links[0].notion_id)
+                return None
+            elif content_block.__class__.__name__ != block_links[0].the_type:
+                client.remove_content_block(block_links[0].notion_id)
+                return client.create_content_block(item_link.notion_id, content_block)
+            else:
+                return client.update_content_block(
+                    content_block.assign_notion_id(block_links[0].notion_id)
+                )
+        elif content_block is not None:
+            return client.create_content_block(item_link.notion_id, content_block)
+        else:
+            return None
+
+    @staticmethod
+    def _map_concurrently(
+        func: Callable[[_RequestT], _ResponseT], requests: List[_RequestT]
+    ) -> List[Union[_ResponseT, Exception]]:
+        """Run independent Notion API calls on a bounded pool, in the given order."""
+        # Only the Notion API calls, which are plain stateless HTTP requests, run
+        # here. The link storage is read and written on the calling thread. A call
+        # which fails doesn't stop the others, and its error is returned in place of
+        # its result, so callers can still record what did change on Notion.
+
+        def call(request: _RequestT) -> Union[_ResponseT, Exception]:
+            try:
+                return func(request)
+            except Exception as err:  # pylint: disable=broad-except
+                return err
+
+        if len(requests) <= 1:
+            return [call(request) for request in requests]
+        with ThreadPoolExecutor(
+            max_workers=NotionCollectionsManager._MAX_CONCURRENT_REQUESTS
+        ) as executor:
+            return list(executor.map(call, requests))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _notion_field_names_for(
+        leaf_type: typing.Type[ItemT],
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Map the fields of a leaf type to their Notion-side names, once per type."""
+        field_names = []
+        for field in dataclasses.fields(leaf_type):
+            if field.name in ("notion_id", "last_edited_time"):
+                continue
+            if field.name == "name":
+                field_names.append((field.name, "title"))
+            else:
+                field_names.append((field.name, field.name.replace("_", "-")))
+        return tuple(field_names)
+
     def _transform_leaf_into_collection_item(
         self,
         timezone: Timezone,
@@ -1196,18 +1423,11 @@ class NotionCollectionsManager:
         properties: JSONDictType = {}
         schema_alt_ids: typing.Any = {s["alt-id"]: v for v, s in schema.items() if "alt-id" in s}  # type: ignore
 
-        for field in dataclasses.fields(item):
-            field_name = field.name
+        for field_name, field_name_notion in self._notion_field_names_for(type(item)):
             field_value = item.__dict__[field_name]
 
-            if field_name in ("notion_id", "last_edited_time"):
-                continue
             if no_properties_fields is not None and field_name in no_properties_fields:
                 continue
-            if field_name == "name":
-                field_name_notion = "title"
-            else:
-                field_name_notion = field_name.replace("_", "-")
             if (
                 field_name_notion not in schema
                 and field_name_notion not in schema_alt_ids
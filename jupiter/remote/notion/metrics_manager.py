@@ -273,6 +273,22 @@ class NotionMetricsManager(MetricNotionManager):
                 f"Notion metric entry with id {branch_ref_id} does not exist"
             ) from err
 
+    def remove_leaves(
+        self,
+        trunk_ref_id: EntityId,
+        branch_ref_id: EntityId,
+        leaf_ref_ids: typing.Iterable[EntityId],
+    ) -> typing.List[EntityId]:
+        """Remove a batch of metric entries on Notion-side, returning missing ids."""
+        leaf_ref_ids_by_key = {
+            NotionLockKey(f"{leaf_ref_id}"): leaf_ref_id for leaf_ref_id in leaf_ref_ids
+        }
+        missing_keys = self._collections_manager.remove_collection_items(
+            keys=leaf_ref_ids_by_key.keys(),
+            collection_key=NotionLockKey(f"{self._KEY}:{trunk_ref_id}:{branch_ref_id}"),
+        )
+        return [leaf_ref_ids_by_key[key] for key in missing_keys]
+
     def drop_all_leaves(self, trunk_ref_id: EntityId, branch_ref_id: EntityId) -> None:
         """Remove all metric entries Notion-side."""
         self._collections_manager.drop_all_collection_items(
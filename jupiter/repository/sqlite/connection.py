@@ -9,6 +9,7 @@ from alembic import command
 from alembic.config import Config
 from sqlalchemy import create_engine
 from sqlalchemy.future import Engine
+from sqlalchemy.pool import QueuePool
 
 from jupiter.framework.storage import Connection
 
@@ -30,8 +31,13 @@ class SqliteConnection(Connection):
     def __init__(self, config: Config) -> None:
         """Constructor."""
         self._config = config
+        # Keep connections open across units of work instead of reconnecting for each,
+        # which is what SQLAlchemy does by default for file backed SQLite databases.
         self._sql_engine = create_engine(
-            config.sqlite_db_url, future=True, json_serializer=json.dumps
+            config.sqlite_db_url,
+            future=True,
+            json_serializer=json.dumps,
+            poolclass=QueuePool,
         )
 
     def prepare(self) -> None:
@@ -48,6 +54,7 @@ class SqliteConnection(Connection):
     def nuke(self) -> None:
         """Completely destroy the Sqlite storage."""
         real_path = self._config.sqlite_db_url.replace("sqlite+pysqlite:///", "")
+        self._sql_engine.dispose()
         os.remove(real_path)
 
     @property
@@ -1,7 +1,8 @@
 """The SQLite repository for inbox tasks."""
-from typing import Optional, Iterable, Final, List
+from typing import Optional, Iterable, Final, List, Dict
 
 from sqlalchemy import (
+    bindparam,
     insert,
     MetaData,
     Table,
@@ -316,62 +317,7 @@ class SqliteInboxTaskRepository(InboxTaskRepository):
         result = self._connection.execute(
             update(self._inbox_task_table)
             .where(self._inbox_task_table.c.ref_id == entity.ref_id.as_int())
-            .values(
-                version=entity.version,
-                archived=entity.archived,
-                created_time=entity.created_time.to_db(),
-                last_modified_time=entity.last_modified_time.to_db(),
-                archived_time=entity.archived_time.to_db()
-                if entity.archived_time
-                else None,
-                inbox_task_collection_ref_id=entity.inbox_task_collection_ref_id.as_int(),
-                source=str(entity.source),
-                project_ref_id=entity.project_ref_id.as_int(),
-                big_plan_ref_id=entity.big_plan_ref_id.as_int()
-                if entity.big_plan_ref_id
-                else None,
-                habit_ref_id=entity.habit_ref_id.as_int()
-                if entity.habit_ref_id
-                else None,
-                chore_ref_id=entity.chore_ref_id.as_int()
-                if entity.chore_ref_id
-                else None,
-                metric_ref_id=entity.metric_ref_id.as_int()
-                if entity.metric_ref_id
-                else None,
-                person_ref_id=entity.person_ref_id.as_int()
-                if entity.person_ref_id
-                else None,
-                slack_task_ref_id=entity.slack_task_ref_id.as_int()
-                if entity.slack_task_ref_id
-                else None,
-                email_task_ref_id=entity.email_task_ref_id.as_int()
-                if entity.email_task_ref_id
-                else None,
-                name=str(entity.name),
-                status=str(entity.status),
-                eisen=str(entity.eisen),
-                difficulty=str(entity.difficulty) if entity.difficulty else None,
-                actionable_date=entity.actionable_date.to_db()
-                if entity.actionable_date
-                else None,
-                due_date=entity.due_date.to_db() if entity.due_date else None,
-                notes=entity.notes,
-                recurring_timeline=entity.recurring_timeline,
-                recurring_repeat_index=entity.recurring_repeat_index,
-                recurring_gen_right_now=entity.recurring_gen_right_now.to_db()
-                if entity.recurring_gen_right_now
-                else None,
-                accepted_time=entity.accepted_time.to_db()
-                if entity.accepted_time
-                else None,
-                working_time=entity.working_time.to_db()
-                if entity.working_time
-                else None,
-                completed_time=entity.completed_time.to_db()
-                if entity.completed_time
-                else None,
-            )
+            .values(**self._entity_to_row(entity))
         )
         if result.rowcount == 0:
             raise InboxTaskNotFoundError(
@@ -380,6 +326,26 @@ class SqliteInboxTaskRepository(InboxTaskRepository):
         upsert_events(self._connection, self._inbox_task_event_table, entity)
         return entity
 
+    def save_many(self, entities: Iterable[InboxTask]) -> List[InboxTask]:
+        """Save a batch of inbox tasks with a single statement."""
+        all_entities = list(entities)
+        if len(all_entities) == 0:
+            return all_entities
+        result = self._connection.execute(
+            update(self._inbox_task_table).where(
+                self._inbox_task_table.c.ref_id == bindparam("the_ref_id")
+            ),
+            [
+                dict(the_ref_id=entity.ref_id.as_int(), **self._entity_to_row(entity))
+                for entity in all_entities
+            ],
+        )
+        if result.rowcount != len(all_entities):
+            raise InboxTaskNotFoundError("Some of the inbox tasks do not exist")
+        for entity in all_entities:
+            upsert_events(self._connection, self._inbox_task_event_table, entity)
+        return all_entities
+
     def load_by_id(self, ref_id: EntityId, allow_archived: bool = False) -> InboxTask:
         """Retrieve an inbox task."""
         query_stmt = select(self._inbox_task_table).where(
@@ -509,6 +475,59 @@ class SqliteInboxTaskRepository(InboxTaskRepository):
         remove_events(self._connection, self._inbox_task_event_table, ref_id)
         return self._row_to_entity(result)
 
+    @staticmethod
+    def _entity_to_row(entity: InboxTask) -> Dict[str, object]:
+        return dict(
+            version=entity.version,
+            archived=entity.archived,
+            created_time=entity.created_time.to_db(),
+            last_modified_time=entity.last_modified_time.to_db(),
+            archived_time=entity.archived_time.to_db()
+            if entity.archived_time
+            else None,
+            inbox_task_collection_ref_id=entity.inbox_task_collection_ref_id.as_int(),
+            source=str(entity.source),
+            project_ref_id=entity.project_ref_id.as_int(),
+            big_plan_ref_id=entity.big_plan_ref_id.as_int()
+            if entity.big_plan_ref_id
+            else None,
+            habit_ref_id=entity.habit_ref_id.as_int() if entity.habit_ref_id else None,
+            chore_ref_id=entity.chore_ref_id.as_int() if entity.chore_ref_id else None,
+            metric_ref_id=entity.metric_ref_id.as_int()
+            if entity.metric_ref_id
+            else None,
+            person_ref_id=entity.person_ref_id.as_int()
+            if entity.person_ref_id
+            else None,
+            slack_task_ref_id=entity.slack_task_ref_id.as_int()
+            if entity.slack_task_ref_id
+            else None,
+            email_task_ref_id=entity.email_task_ref_id.as_int()
+            if entity.email_task_ref_id
+            else None,
+            name=str(entity.name),
+            status=str(entity.status),
+            eisen=str(entity.eisen),
+            difficulty=str(entity.difficulty) if entity.difficulty else None,
+            actionable_date=entity.actionable_date.to_db()
+            if entity.actionable_date
+            else None,
+            due_date=entity.due_date.to_db() if entity.due_date else None,
+            notes=entity.notes,
+            recurring_timeline=entity.recurring_timeline,
+            recurring_repeat_index=entity.recurring_repeat_index,
+            recurring_gen_right_now=entity.recurring_gen_right_now.to_db()
+            if entity.recurring_gen_right_now
+            else None,
+            accepted_time=entity.accepted_time.to_db()
+            if entity.accepted_time
+            else None,
+            working_time=entity.working_time.to_db() if entity.working_time else None,
+            completed_time=entity.completed_time.to_db()
+            if entity.completed_time
+            else None,
+        )
+
     @staticmethod
     def _row_to_entity(row: Result) -> InboxTask:
         return InboxTask(
@@ -5,6 +5,7 @@ from types import TracebackType
 from typing import Final, Iterator, Optional, Type
 
 from sqlalchemy import MetaData
+from sqlalchemy.engine import Connection
 from sqlalchemy.future import Engine
 
 from jupiter.domain.big_plans.big_plan import BigPlan
@@ -541,102 +542,112 @@ class SqliteDomainStorageEngine(DomainStorageEngine):
     def get_unit_of_work(self) -> Iterator[DomainUnitOfWork]:
         """Get the unit of work."""
         with self._sql_engine.begin() as connection:
-            workspace_repository = SqliteWorkspaceRepository(connection, self._metadata)
-            vacation_collection_repository = SqliteVacationCollectionRepository(
-                connection, self._metadata
-            )
-            vacation_repository = SqliteVacationRepository(connection, self._metadata)
-            project_collection_repository = SqliteProjectCollectionRepository(
-                connection, self._metadata
-            )
-            project_repository = SqliteProjectRepository(connection, self._metadata)
-            inbox_task_collection_repository = SqliteInboxTaskCollectionRepository(
-                connection, self._metadata
-            )
-            inbox_task_repository = SqliteInboxTaskRepository(
-                connection, self._metadata
-            )
-            habit_collection_repository = SqliteHabitCollectionRepository(
-                connection, self._metadata
-            )
-            habit_repository = SqliteHabitRepository(connection, self._metadata)
-            chore_collection_repository = SqliteChoreCollectionRepository(
-                connection, self._metadata
-            )
-            chore_repository = SqliteChoreRepository(connection, self._metadata)
-            big_plan_collection_repository = SqliteBigPlanCollectionRepository(
-                connection, self._metadata
-            )
-            big_plan_repository = SqliteBigPlanRepository(connection, self._metadata)
-            smart_list_collection_repository = SqliteSmartListCollectionRepository(
-                connection, self._metadata
-            )
-            smart_list_repository = SqliteSmartListRepository(
-                connection, self._metadata
-            )
-            smart_list_tag_repository = SqliteSmartListTagRepository(
-                connection, self._metadata
-            )
-            smart_list_item_repository = SqliteSmartListItemRepository(
-                connection, self._metadata
-            )
-            metric_collection_repository = SqliteMetricCollectionRepository(
-                connection, self._metadata
-            )
-            metric_repository = SqliteMetricRepository(connection, self._metadata)
-            metric_entry_repository = SqliteMetricEntryRepository(
-                connection, self._metadata
-            )
-            person_collection_repository = SqlitePersonCollectionRepository(
-                connection, self._metadata
-            )
-            person_repository = SqlitePersonRepository(connection, self._metadata)
-            push_integration_group_repository = SqlitePushIntegrationGroupRepository(
-                connection, self._metadata
-            )
-            slack_task_collection_repository = SqliteSlackTaskCollectionRepository(
-                connection, self._metadata
-            )
-            slack_task_repository = SqliteSlackTaskRepository(
-                connection, self._metadata
-            )
-            email_task_collection_repository = SqliteEmailTaskCollectionRepository(
-                connection, self._metadata
-            )
-            email_task_repository = SqliteEmailTaskRepository(
-                connection, self._metadata
-            )
-            notion_connection_repository = SqliteNotionConnectionRepository(
-                connection, self._metadata
-            )
+            yield self._build_unit_of_work(connection)
 
-            yield SqliteDomainUnitOfWork(
-                workspace_repository=workspace_repository,
-                vacation_collection_repository=vacation_collection_repository,
-                vacation_repository=vacation_repository,
-                project_collection_repository=project_collection_repository,
-                project_repository=project_repository,
-                inbox_task_collection_repository=inbox_task_collection_repository,
-                inbox_task_repository=inbox_task_repository,
-                habit_collection_repository=habit_collection_repository,
-                habit_repository=habit_repository,
-                chore_collection_repository=chore_collection_repository,
-                chore_repository=chore_repository,
-                big_plan_collection_repository=big_plan_collection_repository,
-                big_plan_repository=big_plan_repository,
-                smart_list_collection_repository=smart_list_collection_repository,
-                smart_list_repository=smart_list_repository,
-                smart_list_tag_repository=smart_list_tag_repository,
-                smart_list_item_repository=smart_list_item_repository,
-                metric_collection_repository=metric_collection_repository,
-                metric_repository=metric_repository,
-                metric_entry_repository=metric_entry_repository,
-                person_collection_repository=person_collection_repository,
-                person_repository=person_repository,
-                push_integration_group_repository=push_integration_group_repository,
-                slack_task_collection_repository=slack_task_collection_repository,
-                slack_task_repository=slack_task_repository,
-                email_task_collection_repository=email_task_collection_repository,
-                email_task_repository=email_task_repository,
-                notion_connection_repository=notion_connection_repository,
-            )
+    @contextmanager
+    def get_read_only_unit_of_work(self) -> Iterator[DomainUnitOfWork]:
+        """Get a unit of work that only reads, and which never commits."""
+        with self._sql_engine.connect() as connection:
+            # Make SQLite reject writes, instead of having them silently rolled back.
+            # Connections are pooled, so the setting must be undone before this one
+            # goes back to the pool.
+            connection.exec_driver_sql("PRAGMA query_only = ON")
+            try:
+                yield self._build_unit_of_work(connection)
+            finally:
+                connection.rollback()
+                connection.exec_driver_sql("PRAGMA query_only = OFF")
+
+    def _build_unit_of_work(self, connection: Connection) -> SqliteDomainUnitOfWork:
+        """Build a unit of work on top of a connection."""
+        workspace_repository = SqliteWorkspaceRepository(connection, self._metadata)
+        vacation_collection_repository = SqliteVacationCollectionRepository(
+            connection, self._metadata
+        )
+        vacation_repository = SqliteVacationRepository(connection, self._metadata)
+        project_collection_repository = SqliteProjectCollectionRepository(
+            connection, self._metadata
+        )
+        project_repository = SqliteProjectRepository(connection, self._metadata)
+        inbox_task_collection_repository = SqliteInboxTaskCollectionRepository(
+            connection, self._metadata
+        )
+        inbox_task_repository = SqliteInboxTaskRepository(connection, self._metadata)
+        habit_collection_repository = SqliteHabitCollectionRepository(
+            connection, self._metadata
+        )
+        habit_repository = SqliteHabitRepository(connection, self._metadata)
+        chore_collection_repository = SqliteChoreCollectionRepository(
+            connection, self._metadata
+        )
+        chore_repository = SqliteChoreRepository(connection, self._metadata)
+        big_plan_collection_repository = SqliteBigPlanCollectionRepository(
+            connection, self._metadata
+        )
+        big_plan_repository = SqliteBigPlanRepository(connection, self._metadata)
+        smart_list_collection_repository = SqliteSmartListCollectionRepository(
+            connection, self._metadata
+        )
+        smart_list_repository = SqliteSmartListRepository(connection, self._metadata)
+        smart_list_tag_repository = SqliteSmartListTagRepository(
+            connection, self._metadata
+        )
+        smart_list_item_repository = SqliteSmartListItemRepository(
+            connection, self._metadata
+        )
+        metric_collection_repository = SqliteMetricCollectionRepository(
+            connection, self._metadata
+        )
+        metric_repository = SqliteMetricRepository(connection, self._metadata)
+        metric_entry_repository = SqliteMetricEntryRepository(
+            connection, self._metadata
+        )
+        person_collection_repository = SqlitePersonCollectionRepository(
+            connection, self._metadata
+        )
+        person_repository = SqlitePersonRepository(connection, self._metadata)
+        push_integration_group_repository = SqlitePushIntegrationGroupRepository(
+            connection, self._metadata
+        )
+        slack_task_collection_repository = SqliteSlackTaskCollectionRepository(
+            connection, self._metadata
+        )
+        slack_task_repository = SqliteSlackTaskRepository(connection, self._metadata)
+        email_task_collection_repository = SqliteEmailTaskCollectionRepository(
+            connection, self._metadata
+        )
+        email_task_repository = SqliteEmailTaskRepository(connection, self._metadata)
+        notion_connection_repository = SqliteNotionConnectionRepository(
+            connection, self._metadata
+        )
+
+        return SqliteDomainUnitOfWork(
+            workspace_repository=workspace_repository,
+            vacation_collection_repository=vacation_collection_repository,
+            vacation_repository=vacation_repository,
+            project_collection_repository=project_collection_repository,
+            project_repository=project_repository,
+            inbox_task_collection_repository=inbox_task_collection_repository,
+            inbox_task_repository=inbox_task_repository,
+            habit_collection_repository=habit_collection_repository,
+            habit_repository=habit_repository,
+            chore_collection_repository=chore_collection_repository,
+            chore_repository=chore_repository,
+            big_plan_collection_repository=big_plan_collection_repository,
+            big_plan_repository=big_plan_repository,
+            smart_list_collection_repository=smart_list_collection_repository,
+            smart_list_repository=smart_list_repository,
+            smart_list_tag_repository=smart_list_tag_repository,
+            smart_list_item_repository=smart_list_item_repository,
+            metric_collection_repository=metric_collection_repository,
+            metric_repository=metric_repository,
+            metric_entry_repository=metric_entry_repository,
+            person_collection_repository=person_collection_repository,
+            person_repository=person_repository,
+            push_integration_group_repository=push_integration_group_repository,
+            slack_task_collection_repository=slack_task_collection_repository,
+            slack_task_repository=slack_task_repository,
+            email_task_collection_repository=email_task_collection_repository,
+            email_task_repository=email_task_repository,
+            notion_connection_repository=notion_connection_repository,
+        )
@@ -43,6 +43,10 @@ class BigPlanArchiveUseCase(AppMutationUseCase["BigPlanArchiveUseCase.Args", Non
 
     _inbox_task_notion_manager: Final[InboxTaskNotionManager]
     _big_plan_notion_manager: Final[BigPlanNotionManager]
+    _inbox_task_archive_service: Final[InboxTaskArchiveService]
+    _inbox_task_big_plan_ref_options_update_service: Final[
+        InboxTaskBigPlanRefOptionsUpdateService
+    ]
 
     def __init__(
         self,
@@ -56,6 +60,17 @@ class BigPlanArchiveUseCase(AppMutationUseCase["BigPlanArchiveUseCase.Args", Non
         super().__init__(time_provider, invocation_recorder, storage_engine)
         self._inbox_task_notion_manager = inbox_task_notion_manager
         self._big_plan_notion_manager = big_plan_notion_manager
+        self._inbox_task_archive_service = InboxTaskArchiveService(
+            source=EventSource.CLI,
+            time_provider=time_provider,
+            storage_engine=storage_engine,
+            inbox_task_notion_manager=inbox_task_notion_manager,
+        )
+        self._inbox_task_big_plan_ref_options_update_service = (
+            InboxTaskBigPlanRefOptionsUpdateService(
+                storage_engine, inbox_task_notion_manager
+            )
+        )
 
     def _execute(
         self,
@@ -75,14 +90,9 @@ class BigPlanArchiveUseCase(AppMutationUseCase["BigPlanArchiveUseCase.Args", Non
                 filter_big_plan_ref_ids=[args.ref_id],
             )
 
-        inbox_task_archive_service = InboxTaskArchiveService(
-            source=EventSource.CLI,
-            time_provider=self._time_provider,
-            storage_engine=self._storage_engine,
-            inbox_task_notion_manager=self._inbox_task_notion_manager,
+        self._inbox_task_archive_service.do_it_bulk(
+            progress_reporter, inbox_tasks_for_big_plan
         )
-        for inbox_task in inbox_tasks_for_big_plan:
-            inbox_task_archive_service.do_it(progress_reporter, inbox_task)
 
         with progress_reporter.start_archiving_entity(
             "big plan", args.ref_id
@@ -110,7 +120,7 @@ class BigPlanArchiveUseCase(AppMutationUseCase["BigPlanArchiveUseCase.Args", Non
                 )
                 entity_reporter.mark_remote_change(success=MarkProgressStatus.FAILED)
 
-            InboxTaskBigPlanRefOptionsUpdateService(
-                self._storage_engine, self._inbox_task_notion_manager
-            ).sync(big_plan_collection)
+            self._inbox_task_big_plan_ref_options_update_service.sync(
+                big_plan_collection
+            )
             entity_reporter.mark_other_progress("inbox-task-refs")
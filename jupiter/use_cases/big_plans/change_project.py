@@ -88,7 +88,6 @@ class BigPlanChangeProjectUseCase(
                 )
 
                 uow.big_plan_repository.save(big_plan)
-                entity_reporter.mark_local_change()
 
                 inbox_task_collection = (
                     uow.inbox_task_collection_repository.load_by_parent(
@@ -101,8 +100,12 @@ class BigPlanChangeProjectUseCase(
                     filter_big_plan_ref_ids=[big_plan.ref_id],
                 )
 
+            # The local transaction is committed before any Notion I/O happens.
+            entity_reporter.mark_local_change()
+
+            all_projects_map = {project.ref_id: project}
             big_plan_direct_info = NotionBigPlan.DirectInfo(
-                all_projects_map={project.ref_id: project}
+                all_projects_map=all_projects_map
             )
 
             notion_big_plan = self._big_plan_notion_manager.load_leaf(
@@ -116,6 +119,11 @@ class BigPlanChangeProjectUseCase(
             )
             entity_reporter.mark_remote_change()
 
+        inbox_task_direct_info = NotionInboxTask.DirectInfo(
+            all_projects_map=all_projects_map,
+            all_big_plans_map={big_plan.ref_id: big_plan},
+        )
+
         for inbox_task in all_inbox_tasks:
             with progress_reporter.start_updating_entity(
                 "inbox task", inbox_task.ref_id, str(inbox_task.name)
@@ -131,10 +139,6 @@ class BigPlanChangeProjectUseCase(
                     uow.inbox_task_repository.save(inbox_task)
                     entity_reporter.mark_local_change()
 
-                inbox_task_direct_info = NotionInboxTask.DirectInfo(
-                    all_projects_map={project.ref_id: project},
-                    all_big_plans_map={big_plan.ref_id: big_plan},
-                )
                 notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
                     inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
                 )
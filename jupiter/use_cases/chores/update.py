@@ -153,8 +153,9 @@ class ChoreUpdateUseCase(AppMutationUseCase["ChoreUpdateUseCase.Args", None]):
                 uow.chore_repository.save(chore)
                 entity_reporter.mark_local_change()
 
+            all_projects_map = {project.ref_id: project}
             chore_direct_info = NotionChore.DirectInfo(
-                all_projects_map={project.ref_id: project}
+                all_projects_map=all_projects_map
             )
             notion_chore = self._chore_notion_manager.load_leaf(
                 chore.chore_collection_ref_id, chore.ref_id
@@ -178,6 +179,10 @@ class ChoreUpdateUseCase(AppMutationUseCase["ChoreUpdateUseCase.Args", None]):
                     filter_chore_ref_ids=[chore.ref_id],
                 )
 
+            inbox_task_direct_info = NotionInboxTask.DirectInfo(
+                all_projects_map=all_projects_map, all_big_plans_map={}
+            )
+
             for inbox_task in all_inbox_tasks:
                 with progress_reporter.start_updating_entity(
                     "inbox task", inbox_task.ref_id, str(inbox_task.name)
@@ -218,9 +223,6 @@ class ChoreUpdateUseCase(AppMutationUseCase["ChoreUpdateUseCase.Args", None]):
                         )
                         continue
 
-                    inbox_task_direct_info = NotionInboxTask.DirectInfo(
-                        all_projects_map={project.ref_id: project}, all_big_plans_map={}
-                    )
                     notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
                         inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
                     )
@@ -30,6 +30,7 @@ class InboxTaskRemoveUseCase(AppMutationUseCase["InboxTaskRemoveUseCase.Args", N
         ref_id: EntityId
 
     _inbox_task_notion_manager: Final[InboxTaskNotionManager]
+    _inbox_task_remove_service: Final[InboxTaskRemoveService]
 
     def __init__(
         self,
@@ -41,6 +42,9 @@ class InboxTaskRemoveUseCase(AppMutationUseCase["InboxTaskRemoveUseCase.Args", N
         """Constructor."""
         super().__init__(time_provider, invocation_recorder, storage_engine)
         self._inbox_task_notion_manager = inbox_task_notion_manager
+        self._inbox_task_remove_service = InboxTaskRemoveService(
+            storage_engine, inbox_task_notion_manager
+        )
 
     def _execute(
         self,
@@ -49,10 +53,4 @@ class InboxTaskRemoveUseCase(AppMutationUseCase["InboxTaskRemoveUseCase.Args", N
         args: Args,
     ) -> None:
         """Execute the command's action."""
-        with self._storage_engine.get_unit_of_work() as uow:
-            inbox_task = uow.inbox_task_repository.load_by_id(
-                args.ref_id, allow_archived=True
-            )
-        InboxTaskRemoveService(
-            self._storage_engine, self._inbox_task_notion_manager
-        ).do_it(progress_reporter, inbox_task)
+        self._inbox_task_remove_service.do_it_by_id(progress_reporter, args.ref_id)
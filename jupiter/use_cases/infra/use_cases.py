@@ -49,7 +49,7 @@ class AppMutationUseCase(
         self._storage_engine = storage_engine
 
     def _build_context(self) -> AppUseCaseContext:
-        with self._storage_engine.get_unit_of_work() as uow:
+        with self._storage_engine.get_read_only_unit_of_work() as uow:
             workspace = uow.workspace_repository.load()
             return AppUseCaseContext(workspace)
 
@@ -69,6 +69,6 @@ class AppReadonlyUseCase(
         self._storage_engine = storage_engine
 
     def _build_context(self) -> AppUseCaseContext:
-        with self._storage_engine.get_unit_of_work() as uow:
+        with self._storage_engine.get_read_only_unit_of_work() as uow:
             workspace = uow.workspace_repository.load()
             return AppUseCaseContext(workspace)
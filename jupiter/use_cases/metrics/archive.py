@@ -11,7 +11,6 @@ from jupiter.domain.inbox_tasks.service.archive_service import InboxTaskArchiveS
 from jupiter.domain.metrics.infra.metric_notion_manager import (
     MetricNotionManager,
     NotionMetricNotFoundError,
-    NotionMetricEntryNotFoundError,
 )
 from jupiter.domain.metrics.metric_key import MetricKey
 from jupiter.domain.storage_engine import DomainStorageEngine
@@ -94,27 +93,36 @@ class MetricArchiveUseCase(AppMutationUseCase["MetricArchiveUseCase.Args", None]
         for inbox_task in inbox_tasks_to_archive:
             inbox_task_archive_service.do_it(progress_reporter, inbox_task)
 
-        for metric_entry in metric_entries_to_archive:
+        now = self._time_provider.get_current_time()
+        archived_metric_entries = [
+            metric_entry.mark_archived(EventSource.CLI, now)
+            for metric_entry in metric_entries_to_archive
+        ]
+        with self._storage_engine.get_unit_of_work() as uow:
+            for metric_entry in archived_metric_entries:
+                uow.metric_entry_repository.save(metric_entry)
+
+        # Missing entries are reported back instead of raising one error for each.
+        not_found_ref_ids = set(
+            self._metric_notion_manager.remove_leaves(
+                metric_collection.ref_id,
+                metric.ref_id,
+                [me.ref_id for me in archived_metric_entries],
+            )
+        )
+
+        for metric_entry in archived_metric_entries:
             with progress_reporter.start_archiving_entity(
                 "metric entry", metric_entry.ref_id, str(metric_entry.simple_name)
             ) as entity_reporter:
-                with self._storage_engine.get_unit_of_work() as uow:
-                    metric_entry = metric_entry.mark_archived(
-                        EventSource.CLI, self._time_provider.get_current_time()
-                    )
-                    uow.metric_entry_repository.save(metric_entry)
-                    entity_reporter.mark_local_change()
-
-                try:
-                    self._metric_notion_manager.remove_leaf(
-                        metric_collection.ref_id, metric.ref_id, metric_entry.ref_id
-                    )
-                    entity_reporter.mark_remote_change()
-                except NotionMetricEntryNotFoundError:
+                entity_reporter.mark_local_change()
+                if metric_entry.ref_id in not_found_ref_ids:
                     LOGGER.info(
                         "Skipping archival on Notion side because metric entry was not found"
                     )
                     entity_reporter.mark_remote_change(MarkProgressStatus.FAILED)
+                else:
+                    entity_reporter.mark_remote_change()
 
         with progress_reporter.start_archiving_entity(
             "metric", metric.ref_id, str(metric.name)
@@ -102,6 +102,10 @@ class MetricChangeCollectionProjectUseCase(
                     )
                 )
 
+            inbox_task_direct_info = NotionInboxTask.DirectInfo(
+                all_projects_map={project.ref_id: project}, all_big_plans_map={}
+            )
+
             for inbox_task in all_collection_inbox_tasks:
                 with progress_reporter.start_updating_entity(
                     "inbox task", inbox_task.ref_id, str(inbox_task.name)
@@ -131,9 +135,6 @@ class MetricChangeCollectionProjectUseCase(
                         )
                         continue
 
-                    inbox_task_direct_info = NotionInboxTask.DirectInfo(
-                        all_projects_map={project.ref_id: project}, all_big_plans_map={}
-                    )
                     notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
                         inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
                     )
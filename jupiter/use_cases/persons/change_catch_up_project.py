@@ -1,17 +1,24 @@
 """Update the persons catch up project."""
 from dataclasses import dataclass
-from typing import Final, Optional, cast
+from typing import Final, List, Optional
 
-from jupiter.domain.adate import ADate
+from jupiter.domain import schedules
+from jupiter.domain.inbox_tasks.inbox_task import InboxTask
+from jupiter.domain.inbox_tasks.inbox_task_name import InboxTaskName
 from jupiter.domain.inbox_tasks.inbox_task_source import InboxTaskSource
 from jupiter.domain.inbox_tasks.infra.inbox_task_notion_manager import (
     InboxTaskNotionManager,
 )
 from jupiter.domain.inbox_tasks.notion_inbox_task import NotionInboxTask
+from jupiter.domain.inbox_tasks.service.notion_batch_save_service import (
+    InboxTaskNotionBatchSaveService,
+)
 from jupiter.domain.persons.infra.person_notion_manager import PersonNotionManager
 from jupiter.domain.projects.project_key import ProjectKey
+from jupiter.domain.recurring_task_due_at_day import RecurringTaskDueAtDay
+from jupiter.domain.recurring_task_due_at_month import RecurringTaskDueAtMonth
+from jupiter.domain.recurring_task_period import RecurringTaskPeriod
 from jupiter.domain.storage_engine import DomainStorageEngine
-from jupiter.framework.base.entity_id import EntityId
 from jupiter.framework.event import EventSource
 from jupiter.framework.use_case import (
     MutationUseCaseInvocationRecorder,
@@ -22,6 +29,7 @@ from jupiter.use_cases.infra.use_cases import (
     AppUseCaseContext,
     AppMutationUseCase,
 )
+from jupiter.utils.global_properties import GlobalProperties
 from jupiter.utils.time_provider import TimeProvider
 
 
@@ -36,11 +44,14 @@ class PersonChangeCatchUpProjectUseCase(
 
         catch_up_project_key: Optional[ProjectKey]
 
+    _global_properties: Final[GlobalProperties]
     _inbox_task_notion_manager: Final[InboxTaskNotionManager]
     _person_notion_manager: Final[PersonNotionManager]
+    _inbox_task_notion_batch_save_service: Final[InboxTaskNotionBatchSaveService]
 
     def __init__(
         self,
+        global_properties: GlobalProperties,
         time_provider: TimeProvider,
         invocation_recorder: MutationUseCaseInvocationRecorder,
         storage_engine: DomainStorageEngine,
@@ -49,8 +60,12 @@ class PersonChangeCatchUpProjectUseCase(
     ) -> None:
         """Constructor."""
         super().__init__(time_provider, invocation_recorder, storage_engine)
+        self._global_properties = global_properties
         self._inbox_task_notion_manager = inbox_task_notion_manager
         self._person_notion_manager = person_notion_manager
+        self._inbox_task_notion_batch_save_service = InboxTaskNotionBatchSaveService(
+            inbox_task_notion_manager
+        )
 
     def _execute(
         self,
@@ -60,18 +75,19 @@ class PersonChangeCatchUpProjectUseCase(
     ) -> None:
         """Execute the command's action."""
         workspace = context.workspace
+        now = self._time_provider.get_current_time()
 
-        with self._storage_engine.get_unit_of_work() as uow:
-            project_collection = uow.project_collection_repository.load_by_parent(
-                workspace.ref_id
-            )
-
+        # This phase only reads, so it doesn't need a full transaction.
+        with self._storage_engine.get_read_only_unit_of_work() as uow:
             person_collection = uow.person_collection_repository.load_by_parent(
                 workspace.ref_id
             )
             old_catch_up_project_ref_id = person_collection.catch_up_project_ref_id
 
             if args.catch_up_project_key is not None:
+                project_collection = uow.project_collection_repository.load_by_parent(
+                    workspace.ref_id
+                )
                 catch_up_project = uow.project_repository.load_by_key(
                     project_collection.ref_id, args.catch_up_project_key
                 )
@@ -82,100 +98,166 @@ class PersonChangeCatchUpProjectUseCase(
                 )
                 catch_up_project_ref_id = workspace.default_project_ref_id
 
-            persons = uow.person_repository.find_all(
-                parent_ref_id=person_collection.ref_id, allow_archived=False
-            )
+            # The inbox tasks only need to move if the project actually changes.
+            if old_catch_up_project_ref_id != catch_up_project_ref_id:
+                persons = uow.person_repository.find_all(
+                    parent_ref_id=person_collection.ref_id, allow_archived=False
+                )
+            else:
+                persons = []
             persons_by_ref_id = {p.ref_id: p for p in persons}
 
-            inbox_task_collection = uow.inbox_task_collection_repository.load_by_parent(
-                workspace.ref_id
-            )
-            all_catch_up_inbox_tasks = uow.inbox_task_repository.find_all_with_filters(
-                parent_ref_id=inbox_task_collection.ref_id,
-                allow_archived=True,
-                filter_sources=[InboxTaskSource.PERSON_BIRTHDAY],
-                filter_person_ref_ids=[p.ref_id for p in persons],
-            )
-            all_birthday_inbox_tasks = uow.inbox_task_repository.find_all_with_filters(
-                parent_ref_id=inbox_task_collection.ref_id,
-                allow_archived=True,
-                filter_sources=[InboxTaskSource.PERSON_CATCH_UP],
-                filter_person_ref_ids=[p.ref_id for p in persons],
-            )
+            if len(persons) > 0:
+                inbox_task_collection = (
+                    uow.inbox_task_collection_repository.load_by_parent(
+                        workspace.ref_id
+                    )
+                )
+                all_person_inbox_tasks = (
+                    uow.inbox_task_repository.find_all_with_filters(
+                        parent_ref_id=inbox_task_collection.ref_id,
+                        allow_archived=True,
+                        filter_sources=[
+                            InboxTaskSource.PERSON_CATCH_UP,
+                            InboxTaskSource.PERSON_BIRTHDAY,
+                        ],
+                        filter_person_ref_ids=persons_by_ref_id.keys(),
+                    )
+                )
+
+        if len(persons) > 0:
+            all_catch_up_inbox_tasks = [
+                it
+                for it in all_person_inbox_tasks
+                if it.source == InboxTaskSource.PERSON_CATCH_UP
+            ]
+            all_birthday_inbox_tasks = [
+                it
+                for it in all_person_inbox_tasks
+                if it.source == InboxTaskSource.PERSON_BIRTHDAY
+            ]
 
-        if old_catch_up_project_ref_id != catch_up_project_ref_id and len(persons) > 0:
+            updated_inbox_tasks: List[InboxTask] = []
+
+            # The entity adds the "Catch up with" and "Wish happy birthday to"
+            # prefixes to the name itself. So tasks of persons with a schedule get
+            # their name rebuilt from it, as PersonUpdateUseCase does. Persons who
+            # have since dropped their catch ups or birthday only have archived tasks
+            # left. These keep their stored dates and only lose the prefix.
             for inbox_task in all_catch_up_inbox_tasks:
-                with progress_reporter.start_updating_entity(
-                    "inbox task", inbox_task.ref_id, str(inbox_task.name)
-                ) as entity_reporter:
-                    with self._storage_engine.get_unit_of_work() as uow:
-                        inbox_task.update_link_to_person_catch_up(
-                            project_ref_id=catch_up_project_ref_id,
-                            name=inbox_task.name,
-                            recurring_timeline=cast(str, inbox_task.recurring_timeline),
-                            eisen=inbox_task.eisen,
-                            difficulty=inbox_task.difficulty,
-                            actionable_date=inbox_task.actionable_date,
-                            due_time=cast(ADate, inbox_task.due_date),
-                            source=EventSource.CLI,
-                            modification_time=self._time_provider.get_current_time(),
-                        )
-                        entity_reporter.mark_known_name(str(inbox_task.name))
-
-                        uow.inbox_task_repository.save(inbox_task)
-                        entity_reporter.mark_local_change()
-
-                    direct_info = NotionInboxTask.DirectInfo(
-                        all_projects_map={catch_up_project.ref_id: catch_up_project},
-                        all_big_plans_map={},
-                    )
-                    notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
-                        inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
+                if (
+                    inbox_task.person_ref_id is None
+                    or inbox_task.recurring_gen_right_now is None
+                ):
+                    raise Exception(f"Invalid state for {inbox_task}")
+                person = persons_by_ref_id[inbox_task.person_ref_id]
+                if person.catch_up_params is not None:
+                    schedule = schedules.get_schedule(
+                        person.catch_up_params.period,
+                        person.name,
+                        inbox_task.recurring_gen_right_now,
+                        self._global_properties.timezone,
+                        None,
+                        person.catch_up_params.actionable_from_day,
+                        person.catch_up_params.actionable_from_month,
+                        person.catch_up_params.due_at_time,
+                        person.catch_up_params.due_at_day,
+                        person.catch_up_params.due_at_month,
                     )
-                    notion_inbox_task = notion_inbox_task.join_with_entity(
-                        inbox_task, direct_info
+                    inbox_task = inbox_task.update_link_to_person_catch_up(
+                        project_ref_id=catch_up_project_ref_id,
+                        name=schedule.full_name,
+                        recurring_timeline=schedule.timeline,
+                        eisen=inbox_task.eisen,
+                        difficulty=inbox_task.difficulty,
+                        actionable_date=schedule.actionable_date,
+                        due_time=schedule.due_time,
+                        source=EventSource.CLI,
+                        modification_time=now,
                     )
-                    self._inbox_task_notion_manager.save_leaf(
-                        inbox_task.inbox_task_collection_ref_id, notion_inbox_task
+                else:
+                    if (
+                        inbox_task.recurring_timeline is None
+                        or inbox_task.due_date is None
+                    ):
+                        raise Exception(f"Invalid state for {inbox_task}")
+                    inbox_task = inbox_task.update_link_to_person_catch_up(
+                        project_ref_id=catch_up_project_ref_id,
+                        name=_strip_name_prefix(inbox_task.name, "Catch up with "),
+                        recurring_timeline=inbox_task.recurring_timeline,
+                        eisen=inbox_task.eisen,
+                        difficulty=inbox_task.difficulty,
+                        actionable_date=inbox_task.actionable_date,
+                        due_time=inbox_task.due_date,
+                        source=EventSource.CLI,
+                        modification_time=now,
                     )
-                    entity_reporter.mark_remote_change()
+                updated_inbox_tasks.append(inbox_task)
 
             for inbox_task in all_birthday_inbox_tasks:
-                with progress_reporter.start_updating_entity(
-                    "inbox task", inbox_task.ref_id, str(inbox_task.name)
-                ) as entity_reporter:
-                    with self._storage_engine.get_unit_of_work() as uow:
-                        person = persons_by_ref_id[
-                            cast(EntityId, inbox_task.person_ref_id)
-                        ]
-                        inbox_task.update_link_to_person_birthday(
-                            project_ref_id=catch_up_project_ref_id,
-                            name=inbox_task.name,
-                            recurring_timeline=cast(str, inbox_task.recurring_timeline),
-                            preparation_days_cnt=person.preparation_days_cnt_for_birthday,
-                            due_time=cast(ADate, inbox_task.due_date),
-                            source=EventSource.CLI,
-                            modification_time=self._time_provider.get_current_time(),
-                        )
-                        entity_reporter.mark_known_name(str(inbox_task.name))
-
-                        uow.inbox_task_repository.save(inbox_task)
-                        entity_reporter.mark_local_change()
-
-                    direct_info = NotionInboxTask.DirectInfo(
-                        all_projects_map={catch_up_project.ref_id: catch_up_project},
-                        all_big_plans_map={},
-                    )
-                    notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
-                        inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
+                if (
+                    inbox_task.person_ref_id is None
+                    or inbox_task.recurring_gen_right_now is None
+                ):
+                    raise Exception(f"Invalid state for {inbox_task}")
+                person = persons_by_ref_id[inbox_task.person_ref_id]
+                if person.birthday is not None:
+                    schedule = schedules.get_schedule(
+                        RecurringTaskPeriod.YEARLY,
+                        person.name,
+                        inbox_task.recurring_gen_right_now,
+                        self._global_properties.timezone,
+                        None,
+                        None,
+                        None,
+                        None,
+                        RecurringTaskDueAtDay.from_raw(
+                            RecurringTaskPeriod.MONTHLY, person.birthday.day
+                        ),
+                        RecurringTaskDueAtMonth.from_raw(
+                            RecurringTaskPeriod.YEARLY, person.birthday.month
+                        ),
                     )
-                    notion_inbox_task = notion_inbox_task.join_with_entity(
-                        inbox_task, direct_info
+                    inbox_task = inbox_task.update_link_to_person_birthday(
+                        project_ref_id=catch_up_project_ref_id,
+                        name=schedule.full_name,
+                        recurring_timeline=schedule.timeline,
+                        preparation_days_cnt=person.preparation_days_cnt_for_birthday,
+                        due_time=schedule.due_time,
+                        source=EventSource.CLI,
+                        modification_time=now,
                     )
-                    self._inbox_task_notion_manager.save_leaf(
-                        inbox_task.inbox_task_collection_ref_id, notion_inbox_task
+                else:
+                    if (
+                        inbox_task.recurring_timeline is None
+                        or inbox_task.due_date is None
+                    ):
+                        raise Exception(f"Invalid state for {inbox_task}")
+                    inbox_task = inbox_task.update_link_to_person_birthday(
+                        project_ref_id=catch_up_project_ref_id,
+                        name=_strip_name_prefix(
+                            inbox_task.name, "Wish happy birthday to "
+                        ),
+                        recurring_timeline=inbox_task.recurring_timeline,
+                        preparation_days_cnt=person.preparation_days_cnt_for_birthday,
+                        due_time=inbox_task.due_date,
+                        source=EventSource.CLI,
+                        modification_time=now,
                     )
-                    entity_reporter.mark_remote_change()
+                updated_inbox_tasks.append(inbox_task)
+
+            with self._storage_engine.get_unit_of_work() as uow:
+                uow.inbox_task_repository.save_many(updated_inbox_tasks)
+
+            self._inbox_task_notion_batch_save_service.do_it(
+                progress_reporter,
+                inbox_task_collection.ref_id,
+                updated_inbox_tasks,
+                NotionInboxTask.DirectInfo(
+                    all_projects_map={catch_up_project.ref_id: catch_up_project},
+                    all_big_plans_map={},
+                ),
+            )
 
         with progress_reporter.start_updating_entity(
             "person collection", person_collection.ref_id, "Person Collection"
@@ -184,8 +266,16 @@ class PersonChangeCatchUpProjectUseCase(
                 person_collection = person_collection.change_catch_up_project(
                     catch_up_project_ref_id=catch_up_project_ref_id,
                     source=EventSource.CLI,
-                    modified_time=self._time_provider.get_current_time(),
+                    modified_time=now,
                 )
 
                 uow.person_collection_repository.save(person_collection)
                 entity_reporter.mark_local_change()
+
+
+def _strip_name_prefix(name: InboxTaskName, prefix: str) -> InboxTaskName:
+    """Strip a prefix from an inbox task name, however many times it was added."""
+    raw_name = str(name)
+    while raw_name.startswith(prefix):
+        raw_name = raw_name[len(prefix) :]
+    return InboxTaskName.from_raw(raw_name)
@@ -1,17 +1,21 @@
 """Update a person."""
 import typing
 from dataclasses import dataclass
-from typing import Final, Optional
+from typing import Final, List, Optional
 
 from jupiter.domain import schedules
 from jupiter.domain.difficulty import Difficulty
 from jupiter.domain.eisen import Eisen
+from jupiter.domain.inbox_tasks.inbox_task import InboxTask
 from jupiter.domain.inbox_tasks.inbox_task_source import InboxTaskSource
 from jupiter.domain.inbox_tasks.infra.inbox_task_notion_manager import (
     InboxTaskNotionManager,
 )
 from jupiter.domain.inbox_tasks.notion_inbox_task import NotionInboxTask
 from jupiter.domain.inbox_tasks.service.archive_service import InboxTaskArchiveService
+from jupiter.domain.inbox_tasks.service.notion_batch_save_service import (
+    InboxTaskNotionBatchSaveService,
+)
 from jupiter.domain.persons.infra.person_notion_manager import PersonNotionManager
 from jupiter.domain.persons.person_birthday import PersonBirthday
 from jupiter.domain.persons.person_name import PersonName
@@ -30,7 +34,6 @@ from jupiter.framework.use_case import (
     MutationUseCaseInvocationRecorder,
     UseCaseArgsBase,
     ProgressReporter,
-    MarkProgressStatus,
 )
 from jupiter.use_cases.infra.use_cases import (
     AppUseCaseContext,
@@ -63,6 +66,8 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
     _global_properties: Final[GlobalProperties]
     _inbox_task_notion_manager: Final[InboxTaskNotionManager]
     _person_notion_manager: Final[PersonNotionManager]
+    _inbox_task_archive_service: Final[InboxTaskArchiveService]
+    _inbox_task_notion_batch_save_service: Final[InboxTaskNotionBatchSaveService]
 
     def __init__(
         self,
@@ -78,6 +83,15 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
         self._global_properties = global_properties
         self._inbox_task_notion_manager = inbox_task_notion_manager
         self._person_notion_manager = person_notion_manager
+        self._inbox_task_archive_service = InboxTaskArchiveService(
+            source=EventSource.CLI,
+            time_provider=time_provider,
+            storage_engine=storage_engine,
+            inbox_task_notion_manager=inbox_task_notion_manager,
+        )
+        self._inbox_task_notion_batch_save_service = InboxTaskNotionBatchSaveService(
+            inbox_task_notion_manager
+        )
 
     def _execute(
         self,
@@ -87,6 +101,7 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
     ) -> None:
         """Execute the command's action."""
         workspace = context.workspace
+        now = self._time_provider.get_current_time()
 
         with self._storage_engine.get_unit_of_work() as uow:
             person_collection = uow.person_collection_repository.load_by_parent(
@@ -104,74 +119,48 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
                 or args.catch_up_actionable_from_month.should_change
                 or args.catch_up_due_at_time.should_change
                 or args.catch_up_due_at_day.should_change
-                or args.catch_up_due_at_month
+                or args.catch_up_due_at_month.should_change
             ):
-                new_catch_up_period = None
-                if args.catch_up_period.should_change:
-                    new_catch_up_period = args.catch_up_period.value
-                elif person.catch_up_params is not None:
-                    new_catch_up_period = person.catch_up_params.period
+                old_catch_up_params = person.catch_up_params
+                new_catch_up_period = args.catch_up_period.or_else(
+                    old_catch_up_params.period if old_catch_up_params else None
+                )
 
                 if new_catch_up_period is not None:
-                    if args.catch_up_eisen.should_change:
-                        new_catch_up_eisen = args.catch_up_eisen.value
-                    elif person.catch_up_params is not None:
-                        new_catch_up_eisen = person.catch_up_params.eisen
-
-                    new_catch_up_difficulty = None
-                    if args.catch_up_difficulty.should_change:
-                        new_catch_up_difficulty = args.catch_up_difficulty.value
-                    elif person.catch_up_params is not None:
-                        new_catch_up_difficulty = person.catch_up_params.difficulty
-
-                    new_catch_up_actionable_from_day = None
-                    if args.catch_up_actionable_from_day.should_change:
-                        new_catch_up_actionable_from_day = (
-                            args.catch_up_actionable_from_day.value
-                        )
-                    elif person.catch_up_params is not None:
-                        new_catch_up_actionable_from_day = (
-                            person.catch_up_params.actionable_from_day
-                        )
-
-                    new_catch_up_actionable_from_month = None
-                    if args.catch_up_actionable_from_month.should_change:
-                        new_catch_up_actionable_from_month = (
-                            args.catch_up_actionable_from_month.value
-                        )
-                    elif person.catch_up_params is not None:
-                        new_catch_up_actionable_from_month = (
-                            person.catch_up_params.actionable_from_month
+                    if old_catch_up_params is None:
+                        old_catch_up_params = RecurringTaskGenParams(
+                            period=new_catch_up_period,
+                            eisen=Eisen.REGULAR,
+                            difficulty=None,
+                            actionable_from_day=None,
+                            actionable_from_month=None,
+                            due_at_time=None,
+                            due_at_day=None,
+                            due_at_month=None,
                         )
 
-                    new_catch_up_due_at_time = None
-                    if args.catch_up_due_at_time.should_change:
-                        new_catch_up_due_at_time = args.catch_up_due_at_time.value
-                    elif person.catch_up_params is not None:
-                        new_catch_up_due_at_time = person.catch_up_params.due_at_time
-
-                    new_catch_up_due_at_day = None
-                    if args.catch_up_due_at_day.should_change:
-                        new_catch_up_due_at_day = args.catch_up_due_at_day.value
-                    elif person.catch_up_params is not None:
-                        new_catch_up_due_at_day = person.catch_up_params.due_at_day
-
-                    new_catch_up_due_at_month = None
-                    if args.catch_up_due_at_month.should_change:
-                        new_catch_up_due_at_month = args.catch_up_due_at_month.value
-                    elif person.catch_up_params is not None:
-                        new_catch_up_due_at_month = person.catch_up_params.due_at_month
-
                     catch_up_params = UpdateAction.change_to(
                         RecurringTaskGenParams(
-                            period=new_catch_up_period,
-                            eisen=new_catch_up_eisen,
-                            difficulty=new_catch_up_difficulty,
-                            actionable_from_day=new_catch_up_actionable_from_day,
-                            actionable_from_month=new_catch_up_actionable_from_month,
-                            due_at_time=new_catch_up_due_at_time,
-                            due_at_day=new_catch_up_due_at_day,
-                            due_at_month=new_catch_up_due_at_month,
+                            new_catch_up_period,
+                            args.catch_up_eisen.or_else(old_catch_up_params.eisen),
+                            args.catch_up_difficulty.or_else(
+                                old_catch_up_params.difficulty
+                            ),
+                            args.catch_up_actionable_from_day.or_else(
+                                old_catch_up_params.actionable_from_day
+                            ),
+                            args.catch_up_actionable_from_month.or_else(
+                                old_catch_up_params.actionable_from_month
+                            ),
+                            args.catch_up_due_at_time.or_else(
+                                old_catch_up_params.due_at_time
+                            ),
+                            args.catch_up_due_at_day.or_else(
+                                old_catch_up_params.due_at_day
+                            ),
+                            args.catch_up_due_at_month.or_else(
+                                old_catch_up_params.due_at_month
+                            ),
                         )
                     )
                 else:
@@ -198,25 +187,10 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
                 filter_person_ref_ids=[person.ref_id],
             )
 
-        # TODO(horia141): also create tasks here!
-        # TODO(horia141): what if we change other person properties not just catch up params?
-        # Change the catch up inbox tasks
-        if person.catch_up_params is None:
-            # Situation 1: we need to get rid of any existing catch ups persons because there's no collection catch ups.
-            inbox_task_archive_service = InboxTaskArchiveService(
-                source=EventSource.CLI,
-                time_provider=self._time_provider,
-                storage_engine=self._storage_engine,
-                inbox_task_notion_manager=self._inbox_task_notion_manager,
-            )
-            for inbox_task in person_catch_up_tasks:
-                inbox_task_archive_service.do_it(progress_reporter, inbox_task)
-        else:
-            # Situation 2: we need to update the existing persons.
-            for inbox_task in person_catch_up_tasks:
-                with progress_reporter.start_updating_entity(
-                    "inbox task", inbox_task.ref_id, str(inbox_task.name)
-                ) as entity_reporter:
+            # Update the existing catch up and birthday inbox tasks in the same transaction.
+            updated_catch_up_tasks: List[InboxTask] = []
+            if person.catch_up_params is not None:
+                for inbox_task in person_catch_up_tasks:
                     schedule = schedules.get_schedule(
                         person.catch_up_params.period,
                         person.name,
@@ -239,52 +213,22 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
                         actionable_date=schedule.actionable_date,
                         due_time=schedule.due_time,
                         source=EventSource.CLI,
-                        modification_time=self._time_provider.get_current_time(),
+                        modification_time=now,
                     )
-                    entity_reporter.mark_known_name(str(inbox_task.name))
-
-                    # Situation 2a: we're handling the same project.
-                    with self._storage_engine.get_unit_of_work() as uow:
-                        uow.inbox_task_repository.save(inbox_task)
-                        entity_reporter.mark_local_change()
-
-                    if inbox_task.archived:
-                        entity_reporter.mark_remote_change(
-                            MarkProgressStatus.NOT_NEEDED
-                        )
-                        continue
+                    updated_catch_up_tasks.append(inbox_task)
 
-                    direct_info = NotionInboxTask.DirectInfo(
-                        all_projects_map={project.ref_id: project}, all_big_plans_map={}
-                    )
-                    notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
-                        inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
-                    )
-                    notion_inbox_task = notion_inbox_task.join_with_entity(
-                        inbox_task, direct_info
-                    )
-                    self._inbox_task_notion_manager.save_leaf(
-                        inbox_task.inbox_task_collection_ref_id, notion_inbox_task
-                    )
-                    entity_reporter.mark_remote_change()
+                uow.inbox_task_repository.save_many(updated_catch_up_tasks)
 
-        # Change the birthday inbox tasks
-        if person.birthday is None:
-            # Situation 1: we need to get rid of any existing catch ups persons because there's no collection catch ups.
-            inbox_task_archive_service = InboxTaskArchiveService(
-                source=EventSource.CLI,
-                time_provider=self._time_provider,
-                storage_engine=self._storage_engine,
-                inbox_task_notion_manager=self._inbox_task_notion_manager,
-            )
-            for inbox_task in person_birthday_tasks:
-                inbox_task_archive_service.do_it(progress_reporter, inbox_task)
-        else:
-            # Situation 2: we need to update the existing persons.
-            for inbox_task in person_birthday_tasks:
-                with progress_reporter.start_updating_entity(
-                    "inbox task", inbox_task.ref_id, str(inbox_task.name)
-                ) as entity_reporter:
+            updated_birthday_tasks: List[InboxTask] = []
+            if person.birthday is not None:
+                # Only the generation time varies between the birthday tasks.
+                birthday_due_at_day = RecurringTaskDueAtDay.from_raw(
+                    RecurringTaskPeriod.MONTHLY, person.birthday.day
+                )
+                birthday_due_at_month = RecurringTaskDueAtMonth.from_raw(
+                    RecurringTaskPeriod.YEARLY, person.birthday.month
+                )
+                for inbox_task in person_birthday_tasks:
                     schedule = schedules.get_schedule(
                         RecurringTaskPeriod.YEARLY,
                         person.name,
@@ -294,12 +238,8 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
                         None,
                         None,
                         None,
-                        RecurringTaskDueAtDay.from_raw(
-                            RecurringTaskPeriod.MONTHLY, person.birthday.day
-                        ),
-                        RecurringTaskDueAtMonth.from_raw(
-                            RecurringTaskPeriod.YEARLY, person.birthday.month
-                        ),
+                        birthday_due_at_day,
+                        birthday_due_at_month,
                     )
 
                     inbox_task = inbox_task.update_link_to_person_birthday(
@@ -309,34 +249,37 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
                         preparation_days_cnt=person.preparation_days_cnt_for_birthday,
                         due_time=schedule.due_time,
                         source=EventSource.CLI,
-                        modification_time=self._time_provider.get_current_time(),
+                        modification_time=now,
                     )
-                    entity_reporter.mark_known_name(str(inbox_task.name))
+                    updated_birthday_tasks.append(inbox_task)
 
-                    # Situation 2a: we're handling the same project.
-                    with self._storage_engine.get_unit_of_work() as uow:
-                        uow.inbox_task_repository.save(inbox_task)
-                        entity_reporter.mark_local_change()
+                uow.inbox_task_repository.save_many(updated_birthday_tasks)
 
-                    if inbox_task.archived:
-                        entity_reporter.mark_remote_change(
-                            MarkProgressStatus.NOT_NEEDED
-                        )
-                        continue
+        # TODO(horia141): also create tasks here!
+        # TODO(horia141): what if we change other person properties not just catch up params?
+        # Change the catch up inbox tasks
+        if person.catch_up_params is None:
+            # Situation 1: we need to get rid of any existing catch ups persons because there's no collection catch ups.
+            self._inbox_task_archive_service.do_it_bulk(
+                progress_reporter, person_catch_up_tasks
+            )
 
-                    direct_info = NotionInboxTask.DirectInfo(
-                        all_projects_map={project.ref_id: project}, all_big_plans_map={}
-                    )
-                    notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
-                        inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
-                    )
-                    notion_inbox_task = notion_inbox_task.join_with_entity(
-                        inbox_task, direct_info
-                    )
-                    self._inbox_task_notion_manager.save_leaf(
-                        inbox_task.inbox_task_collection_ref_id, notion_inbox_task
-                    )
-                    entity_reporter.mark_remote_change()
+        # Change the birthday inbox tasks
+        if person.birthday is None:
+            # Situation 1: we need to get rid of any existing catch ups persons because there's no collection catch ups.
+            self._inbox_task_archive_service.do_it_bulk(
+                progress_reporter, person_birthday_tasks
+            )
+
+        # Situation 2: we need to update the existing persons, both kinds in one batch.
+        self._inbox_task_notion_batch_save_service.do_it(
+            progress_reporter,
+            inbox_task_collection.ref_id,
+            updated_catch_up_tasks + updated_birthday_tasks,
+            NotionInboxTask.DirectInfo(
+                all_projects_map={project.ref_id: project}, all_big_plans_map={}
+            ),
+        )
 
         with progress_reporter.start_updating_entity(
             "person", person.ref_id, str(person.name)
@@ -348,7 +291,7 @@ class PersonUpdateUseCase(AppMutationUseCase["PersonUpdateUseCase.Args", None]):
                     birthday=args.birthday,
                     catch_up_params=catch_up_params,
                     source=EventSource.CLI,
-                    modification_time=self._time_provider.get_current_time(),
+                    modification_time=now,
                 )
                 entity_reporter.mark_known_name(str(person.name))
 
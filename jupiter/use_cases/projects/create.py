@@ -93,6 +93,8 @@ class ProjectCreateUseCase(AppMutationUseCase["ProjectCreateUseCase.Args", None]
                 new_project = uow.project_repository.create(new_project)
                 entity_reporter.mark_known_name(str(args.name)).mark_local_change()
 
+                projects = uow.project_repository.find_all(project_collection.ref_id)
+
             new_notion_project = NotionProject.new_notion_entity(new_project, None)
             self._project_notion_manager.upsert_leaf(
                 project_collection.ref_id,
@@ -100,9 +102,6 @@ class ProjectCreateUseCase(AppMutationUseCase["ProjectCreateUseCase.Args", None]
             )
             entity_reporter.mark_remote_change()
 
-            with self._storage_engine.get_unit_of_work() as uow:
-                projects = uow.project_repository.find_all(project_collection.ref_id)
-
             ProjectLabelUpdateService(
                 self._storage_engine,
                 self._inbox_task_notion_manager,
@@ -39,7 +39,7 @@ class ProjectFindUseCase(
         """Execute the command's action."""
         workspace = context.workspace
 
-        with self._storage_engine.get_unit_of_work() as uow:
+        with self._storage_engine.get_read_only_unit_of_work() as uow:
             project_collection = uow.project_collection_repository.load_by_parent(
                 workspace.ref_id
             )
@@ -49,4 +49,4 @@ class ProjectFindUseCase(
                 filter_keys=args.filter_keys,
             )
 
-        return self.Result(projects=list(projects))
+        return self.Result(projects=projects)
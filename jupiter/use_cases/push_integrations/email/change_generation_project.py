@@ -108,6 +108,11 @@ class EmailTaskChangeGenerationProjectUseCase(
         ):
             updated_generated_inbox_tasks = []
 
+            direct_info = NotionInboxTask.DirectInfo(
+                all_projects_map={generation_project.ref_id: generation_project},
+                all_big_plans_map={},
+            )
+
             for inbox_task in all_generated_inbox_tasks:
                 with progress_reporter.start_updating_entity(
                     "inbox task", inbox_task.ref_id, str(inbox_task.name)
@@ -134,12 +139,6 @@ class EmailTaskChangeGenerationProjectUseCase(
 
                         updated_generated_inbox_tasks.append(update_inbox_task)
 
-                    direct_info = NotionInboxTask.DirectInfo(
-                        all_projects_map={
-                            generation_project.ref_id: generation_project
-                        },
-                        all_big_plans_map={},
-                    )
                     notion_inbox_task = self._inbox_task_notion_manager.load_leaf(
                         inbox_task.inbox_task_collection_ref_id, inbox_task.ref_id
                     )
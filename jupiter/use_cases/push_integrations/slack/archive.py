@@ -58,7 +58,7 @@ class SlackTaskArchiveUseCase(AppMutationUseCase["SlackTaskArchiveUseCase.Args",
         args: Args,
     ) -> None:
         """Execute the command's action."""
-        with self._storage_engine.get_unit_of_work() as uow:
+        with self._storage_engine.get_read_only_unit_of_work() as uow:
             slack_task = uow.slack_task_repository.load_by_id(ref_id=args.ref_id)
 
         slack_task_archive_service = SlackTaskArchiveService(
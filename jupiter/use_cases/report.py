@@ -1,9 +1,19 @@
 """The command for reporting on progress."""
+from bisect import bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field
-from itertools import groupby
-from operator import itemgetter
-from typing import Optional, Iterable, Final, Dict, List, cast, DefaultDict
+from typing import (
+    Optional,
+    Iterable,
+    Final,
+    Dict,
+    List,
+    cast,
+    DefaultDict,
+    Callable,
+    Tuple,
+    Set,
+)
 
 import pendulum
 from pendulum import UTC
@@ -36,6 +46,202 @@ from jupiter.framework.use_case import (
 from jupiter.use_cases.infra.use_cases import AppReadonlyUseCase, AppUseCaseContext
 from jupiter.utils.global_properties import GlobalProperties
 
+# Per source counters are plain lists, indexed by the position of the source here.
+_ALL_SOURCES = list(InboxTaskSource)
+_SOURCE_IDX = {s: i for i, s in enumerate(_ALL_SOURCES)}
+
+
+def _day_of(timestamp: Timestamp) -> int:
+    # Schedule.contains_timestamp checks the end of the timestamp's day against
+    # whole UTC days, so this is the UTC day it falls in, as a day ordinal.
+    return cast(int, timestamp.value.end_of("day").in_timezone(UTC).toordinal())
+
+
+@dataclass(frozen=True)
+class _ScheduleBounds:
+    """The days of a schedule, as day ordinals, for cheap repeated containment tests."""
+
+    first_day: int
+    end_day: int
+
+    @staticmethod
+    def from_schedule(schedule: Schedule) -> "_ScheduleBounds":
+        """Build the bounds for a schedule."""
+        first_day = schedule.first_day
+        end_day = schedule.end_day
+        return _ScheduleBounds(
+            first_day=pendulum.Date(
+                first_day.year, first_day.month, first_day.day
+            ).toordinal(),
+            end_day=pendulum.Date(end_day.year, end_day.month, end_day.day).toordinal(),
+        )
+
+    def contains_day(self, day: int) -> bool:
+        """Tests whether a day ordinal is in the schedule block."""
+        return self.first_day <= day <= self.end_day
+
+
+class _PhaseFinder:
+    """Finds which of a series of consecutive and disjoint schedules contains a day."""
+
+    _phase_bounds: Final[List[_ScheduleBounds]]
+    _phase_first_days: Final[List[int]]
+
+    def __init__(self, phase_schedules: Iterable[Schedule]) -> None:
+        """Constructor."""
+        self._phase_bounds = [_ScheduleBounds.from_schedule(s) for s in phase_schedules]
+        self._phase_first_days = [b.first_day for b in self._phase_bounds]
+
+    def find_phase(self, day: int) -> Optional[int]:
+        """The index of the phase containing a day ordinal, if there is one."""
+        # Only the last phase starting on or before the day can contain it.
+        phase_idx = bisect_right(self._phase_first_days, day) - 1
+        if phase_idx >= 0 and self._phase_bounds[phase_idx].contains_day(day):
+            return phase_idx
+        return None
+
+
+@dataclass(frozen=True)
+class _WorkableDays:
+    """The days on which an inbox task or big plan's events happened, as ordinals."""
+
+    # There's one of these per inbox task and big plan in a report, so skip the
+    # instance dicts.
+    __slots__ = ("created_day", "progress_kind", "progress_day")
+
+    created_day: int
+    progress_kind: Optional[str]
+    progress_day: Optional[int]
+
+    @staticmethod
+    def from_inbox_task(inbox_task: InboxTask) -> "_WorkableDays":
+        """Compute the days for an inbox task."""
+        if inbox_task.status.is_accepted and inbox_task.accepted_time is None:
+            raise Exception(f"Invalid state for {inbox_task}")
+
+        progress_kind: Optional[str] = None
+        progress_time: Optional[Timestamp] = None
+        if inbox_task.status.is_completed:
+            progress_kind = (
+                "done" if inbox_task.status == InboxTaskStatus.DONE else "not_done"
+            )
+            progress_time = inbox_task.completed_time
+        elif inbox_task.status.is_working:
+            progress_kind = "working"
+            progress_time = inbox_task.working_time
+        elif inbox_task.status.is_accepted:
+            progress_kind = "accepted"
+            progress_time = inbox_task.accepted_time
+
+        return _WorkableDays(
+            created_day=_day_of(inbox_task.created_time),
+            progress_kind=progress_kind,
+            progress_day=_day_of(progress_time) if progress_time is not None else None,
+        )
+
+    @staticmethod
+    def from_big_plan(big_plan: BigPlan) -> "_WorkableDays":
+        """Compute the days for a big plan."""
+        progress_kind: Optional[str] = None
+        progress_time: Optional[Timestamp] = None
+        if big_plan.status.is_completed:
+            progress_kind = (
+                "done" if big_plan.status == BigPlanStatus.DONE else "not_done"
+            )
+            progress_time = big_plan.completed_time
+        elif big_plan.status.is_working:
+            progress_kind = "working"
+            progress_time = big_plan.working_time
+        elif big_plan.status.is_accepted:
+            progress_kind = "accepted"
+            progress_time = big_plan.accepted_time
+
+        return _WorkableDays(
+            created_day=_day_of(big_plan.created_time),
+            progress_kind=progress_kind,
+            progress_day=_day_of(progress_time) if progress_time is not None else None,
+        )
+
+
+class _InboxTasksSummaryBuilder:
+    """Accumulates the counters behind an inbox tasks summary."""
+
+    _per_source_cnt: Final[DefaultDict[str, List[int]]]
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._per_source_cnt = defaultdict(lambda: [0] * len(_ALL_SOURCES))
+
+    def add(self, kind: str, source_idx: int) -> None:
+        """Count one inbox task event of a given kind, for a source index."""
+        self._per_source_cnt[kind][source_idx] += 1
+
+    def build(self) -> "ReportUseCase.InboxTasksSummary":
+        """Build the summary from the counters."""
+        return ReportUseCase.InboxTasksSummary(
+            created=self._build_nested_result("created"),
+            accepted=self._build_nested_result("accepted"),
+            working=self._build_nested_result("working"),
+            not_done=self._build_nested_result("not_done"),
+            done=self._build_nested_result("done"),
+        )
+
+    def _build_nested_result(self, kind: str) -> "ReportUseCase.NestedResult":
+        # Totals are summed up from the handful of sources, rather than being
+        # counted separately for every event.
+        per_source_cnt = self._per_source_cnt[kind]
+        return ReportUseCase.NestedResult(
+            total_cnt=sum(per_source_cnt),
+            per_source_cnt=dict(zip(_ALL_SOURCES, per_source_cnt)),
+        )
+
+
+class _BigPlansSummaryBuilder:
+    """Accumulates the counters and big plans behind a big plans summary."""
+
+    _event_cnt: Final[DefaultDict[str, int]]
+    _not_done_big_plans: Final[List[BigPlan]]
+    _done_big_plans: Final[List[BigPlan]]
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._event_cnt = defaultdict(int)
+        self._not_done_big_plans = []
+        self._done_big_plans = []
+
+    def add(self, kind: str, big_plan: BigPlan) -> None:
+        """Count one big plan event of a given kind."""
+        # The done and not done big plans are only turned into report records once
+        # they've all been picked out, and their counts are just the list lengths.
+        if kind == "done":
+            self._done_big_plans.append(big_plan)
+        elif kind == "not_done":
+            self._not_done_big_plans.append(big_plan)
+        else:
+            self._event_cnt[kind] += 1
+
+    def build(self) -> "ReportUseCase.WorkableSummary":
+        """Build the summary from the counters."""
+        return ReportUseCase.WorkableSummary(
+            created_cnt=self._event_cnt["created"],
+            accepted_cnt=self._event_cnt["accepted"],
+            working_cnt=self._event_cnt["working"],
+            done_cnt=len(self._done_big_plans),
+            not_done_cnt=len(self._not_done_big_plans),
+            not_done_big_plans=[
+                ReportUseCase.WorkableBigPlan(
+                    ref_id=bp.ref_id, name=bp.name, actionable_date=bp.actionable_date
+                )
+                for bp in self._not_done_big_plans
+            ],
+            done_big_plans=[
+                ReportUseCase.WorkableBigPlan(
+                    ref_id=bp.ref_id, name=bp.name, actionable_date=bp.actionable_date
+                )
+                for bp in self._done_big_plans
+            ],
+        )
+
 
 class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Result"]):
     """The command for reporting on progress."""
@@ -196,7 +402,9 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
         workspace = context.workspace
         today = args.right_now.value.date()
 
-        with self._storage_engine.get_unit_of_work() as uow:
+        # All the data the report needs is read up front, in one go, and without
+        # opening a transaction, since nothing gets written.
+        with self._storage_engine.get_read_only_unit_of_work() as uow:
             project_collection = uow.project_collection_repository.load_by_parent(
                 workspace.ref_id
             )
@@ -255,6 +463,14 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
                 None,
             )
 
+            # The filters are checked for every inbox task, so look them up in sets
+            # rather than in whatever iterables they came as.
+            filter_big_plan_ref_ids = self._as_set(args.filter_big_plan_ref_ids)
+            filter_habit_ref_ids = self._as_set(args.filter_habit_ref_ids)
+            filter_chore_ref_ids = self._as_set(args.filter_chore_ref_ids)
+            filter_slack_task_ref_ids = self._as_set(args.filter_slack_task_ref_ids)
+            filter_email_task_ref_ids = self._as_set(args.filter_email_task_ref_ids)
+
             all_inbox_tasks = [
                 it
                 for it in uow.inbox_task_repository.find_all_with_filters(
@@ -268,30 +484,30 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
                 or (
                     it.source is InboxTaskSource.BIG_PLAN
                     and (
-                        not (args.filter_big_plan_ref_ids is not None)
+                        not (filter_big_plan_ref_ids is not None)
                         or (
                             it.big_plan_ref_id is not None
-                            and it.big_plan_ref_id in args.filter_big_plan_ref_ids
+                            and it.big_plan_ref_id in filter_big_plan_ref_ids
                         )
                     )
                 )
                 or (
                     it.source is InboxTaskSource.HABIT
                     and (
-                        not (args.filter_habit_ref_ids is not None)
+                        not (filter_habit_ref_ids is not None)
                         or (
                             it.habit_ref_id is not None
-                            and it.habit_ref_id in args.filter_habit_ref_ids
+                            and it.habit_ref_id in filter_habit_ref_ids
                         )
                     )
                 )
                 or (
                     it.source is InboxTaskSource.CHORE
                     and (
-                        not (args.filter_chore_ref_ids is not None)
+                        not (filter_chore_ref_ids is not None)
                         or (
                             it.chore_ref_id is not None
-                            and it.chore_ref_id in args.filter_chore_ref_ids
+                            and it.chore_ref_id in filter_chore_ref_ids
                         )
                     )
                 )
@@ -315,20 +531,20 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
                 or (
                     it.source is InboxTaskSource.SLACK_TASK
                     and (
-                        not (args.filter_slack_task_ref_ids is not None)
+                        not (filter_slack_task_ref_ids is not None)
                         or (
                             it.slack_task_ref_id is not None
-                            and it.slack_task_ref_id in args.filter_slack_task_ref_ids
+                            and it.slack_task_ref_id in filter_slack_task_ref_ids
                         )
                     )
                 )
                 or (
                     it.source is InboxTaskSource.EMAIL_TASK
                     and (
-                        not (args.filter_email_task_ref_ids is not None)
+                        not (filter_email_task_ref_ids is not None)
                         or (
                             it.email_task_ref_id is not None
-                            and it.email_task_ref_id in args.filter_email_task_ref_ids
+                            and it.email_task_ref_id in filter_email_task_ref_ids
                         )
                     )
                 )
@@ -364,58 +580,22 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
                 bp.ref_id: bp for bp in all_big_plans
             }
 
-        global_inbox_tasks_summary = self._run_report_for_inbox_tasks(
-            schedule, all_inbox_tasks
-        )
-        global_big_plans_summary = self._run_report_for_big_plan(
-            schedule, all_big_plans
-        )
+        # The summaries below look up the project name of every inbox task and big
+        # plan, so those are resolved once per project.
+        project_name_by_ref_id = {k: p.name for (k, p) in projects_by_ref_id.items()}
 
-        # Build per project breakdown
-
-        # all_inbox_tasks.groupBy(it -> it.project.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
-        per_project_inbox_tasks_summary = {
-            k: self._run_report_for_inbox_tasks(schedule, (vx[1] for vx in v))
-            for (k, v) in groupby(
-                sorted(
-                    [
-                        (projects_by_ref_id[it.project_ref_id].name, it)
-                        for it in all_inbox_tasks
-                    ],
-                    key=itemgetter(0),
-                ),
-                key=itemgetter(0),
-            )
+        # Every summary below tests the same few timestamps of each inbox task and
+        # big plan, so they're turned into days once, up front.
+        inbox_task_days = {
+            it.ref_id: _WorkableDays.from_inbox_task(it) for it in all_inbox_tasks
         }
-        # all_big_plans.groupBy(it -> it.project..name).map((k, v) -> (k, run_report_for_group(v))).asDict()
-        per_project_big_plans_summary = {
-            k: self._run_report_for_big_plan(schedule, (vx[1] for vx in v))
-            for (k, v) in groupby(
-                sorted(
-                    [
-                        (projects_by_ref_id[bp.project_ref_id].name, bp)
-                        for bp in all_big_plans
-                    ],
-                    key=itemgetter(0),
-                ),
-                key=itemgetter(0),
-            )
+        big_plan_days = {
+            bp.ref_id: _WorkableDays.from_big_plan(bp) for bp in all_big_plans
         }
-        per_project_breakdown = [
-            ReportUseCase.PerProjectBreakdownItem(
-                name=s,
-                inbox_tasks_summary=v,
-                big_plans_summary=per_project_big_plans_summary.get(
-                    s, ReportUseCase.WorkableSummary(0, 0, 0, 0, 0, [], [])
-                ),
-            )
-            for (s, v) in per_project_inbox_tasks_summary.items()
-        ]
 
-        # Build per period breakdown
-        per_period_breakdown = None
+        # Build the sub-periods of the per period breakdown, if one is asked for
+        all_schedules: Dict[EntityName, Schedule] = {}
         if args.breakdown_period:
-            all_schedules = {}
             curr_date = schedule.first_day.start_of_day()
             end_date = schedule.end_day.end_of_day()
             while curr_date < end_date and curr_date <= today:
@@ -437,115 +617,133 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
                     None,
                 )
                 all_schedules[phase_schedule.full_name] = phase_schedule
-                curr_date = curr_date.next_day()
+                # The remaining days of this sub-period all map back to it, so skip
+                # straight past them instead of rebuilding it for each day.
+                next_phase_date = phase_schedule.end_day.next_day()
+                curr_date = (
+                    next_phase_date
+                    if curr_date < next_phase_date
+                    else curr_date.next_day()
+                )
 
-            per_period_inbox_tasks_summary = {
-                k: self._run_report_for_inbox_tasks(v, all_inbox_tasks)
-                for (k, v) in all_schedules.items()
-            }
-            per_period_big_plans_summary = {
-                k: self._run_report_for_big_plan(v, all_big_plans)
-                for (k, v) in all_schedules.items()
-            }
+        # The global, per project and per period inbox task summaries are all
+        # computed in a single pass over the inbox tasks.
+        (
+            global_inbox_tasks_summary,
+            per_project_inbox_tasks_summary,
+            per_period_inbox_tasks_summaries,
+        ) = self._run_report_for_inbox_tasks(
+            schedule,
+            list(all_schedules.values()),
+            all_inbox_tasks,
+            inbox_task_days,
+            lambda it: project_name_by_ref_id[it.project_ref_id],
+        )
+        # And likewise for the big plan summaries, over the big plans.
+        (
+            global_big_plans_summary,
+            per_project_big_plans_summary,
+            per_period_big_plans_summaries,
+        ) = self._run_report_for_big_plans(
+            schedule,
+            list(all_schedules.values()),
+            all_big_plans,
+            big_plan_days,
+            lambda bp: project_name_by_ref_id[bp.project_ref_id],
+        )
+
+        # Group everything the breakdowns need in a single linear pass. Only the
+        # distinct keys get sorted, to keep the breakdowns ordered as before.
+        (
+            inbox_tasks_by_habit_ref_id,
+            inbox_tasks_by_chore_ref_id,
+            inbox_tasks_by_big_plan_ref_id,
+        ) = self._bucket_by_origin(all_inbox_tasks)
+
+        # Build per project breakdown
+
+        per_project_breakdown = [
+            ReportUseCase.PerProjectBreakdownItem(
+                name=s,
+                inbox_tasks_summary=v,
+                big_plans_summary=per_project_big_plans_summary.get(
+                    s, ReportUseCase.WorkableSummary(0, 0, 0, 0, 0, [], [])
+                ),
+            )
+            for (s, v) in per_project_inbox_tasks_summary.items()
+        ]
+
+        # Build per period breakdown
+        per_period_breakdown = None
+        if args.breakdown_period:
             per_period_breakdown = [
                 ReportUseCase.PerPeriodBreakdownItem(
-                    name=k,
-                    inbox_tasks_summary=v,
-                    big_plans_summary=per_period_big_plans_summary.get(
-                        k, ReportUseCase.WorkableSummary(0, 0, 0, 0, 0, [], [])
-                    ),
+                    name=k, inbox_tasks_summary=v, big_plans_summary=b
+                )
+                for (k, v, b) in zip(
+                    all_schedules,
+                    per_period_inbox_tasks_summaries,
+                    per_period_big_plans_summaries,
                 )
-                for (k, v) in per_period_inbox_tasks_summary.items()
             ]
 
         # Build per habit breakdown
 
         # all_inbox_tasks.groupBy(it -> it.habit.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
         per_habit_breakdown = [
-            hb
-            for hb in (
-                ReportUseCase.PerHabitBreakdownItem(
-                    ref_id=all_habits_by_ref_id[k].ref_id,
-                    name=all_habits_by_ref_id[k].name,
-                    archived=all_habits_by_ref_id[k].archived,
-                    suspended=all_habits_by_ref_id[k].suspended,
-                    period=all_habits_by_ref_id[k].gen_params.period,
-                    summary=self._run_report_for_inbox_for_recurring_tasks(
-                        schedule, [vx[1] for vx in v]
-                    ),
-                )
-                for (k, v) in groupby(
-                    sorted(
-                        [
-                            (it.habit_ref_id, it)
-                            for it in all_inbox_tasks
-                            if it.habit_ref_id
-                        ],
-                        key=itemgetter(0),
-                    ),
-                    key=itemgetter(0),
-                )
+            ReportUseCase.PerHabitBreakdownItem(
+                ref_id=habit.ref_id,
+                name=habit.name,
+                archived=habit.archived,
+                suspended=habit.suspended,
+                period=habit.gen_params.period,
+                summary=self._run_report_for_inbox_for_recurring_tasks(
+                    schedule, inbox_tasks_by_habit_ref_id[habit.ref_id], inbox_task_days
+                ),
+            )
+            for habit in (
+                all_habits_by_ref_id[k] for k in sorted(inbox_tasks_by_habit_ref_id)
             )
-            if all_habits_by_ref_id[hb.ref_id].archived is False
+            if habit.archived is False
         ]
 
         # Build per chore breakdown
 
         # all_inbox_tasks.groupBy(it -> it.chore.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
         per_chore_breakdown = [
-            cb
-            for cb in (
-                ReportUseCase.PerChoreBreakdownItem(
-                    ref_id=all_chores_by_ref_id[k].ref_id,
-                    name=all_chores_by_ref_id[k].name,
-                    archived=all_chores_by_ref_id[k].archived,
-                    period=all_chores_by_ref_id[k].gen_params.period,
-                    summary=self._run_report_for_inbox_for_recurring_tasks(
-                        schedule, [vx[1] for vx in v]
-                    ),
-                )
-                for (k, v) in groupby(
-                    sorted(
-                        [
-                            (it.chore_ref_id, it)
-                            for it in all_inbox_tasks
-                            if it.chore_ref_id
-                        ],
-                        key=itemgetter(0),
-                    ),
-                    key=itemgetter(0),
-                )
+            ReportUseCase.PerChoreBreakdownItem(
+                ref_id=chore.ref_id,
+                name=chore.name,
+                archived=chore.archived,
+                period=chore.gen_params.period,
+                summary=self._run_report_for_inbox_for_recurring_tasks(
+                    schedule, inbox_tasks_by_chore_ref_id[chore.ref_id], inbox_task_days
+                ),
+            )
+            for chore in (
+                all_chores_by_ref_id[k] for k in sorted(inbox_tasks_by_chore_ref_id)
             )
-            if all_chores_by_ref_id[cb.ref_id].archived is False
+            if chore.archived is False
         ]
 
         # Build per big plan breakdown
 
         # all_inbox_tasks.groupBy(it -> it.bigPlan.name).map((k, v) -> (k, run_report_for_group(v))).asDict()
         per_big_plan_breakdown = [
-            bb
-            for bb in (
-                ReportUseCase.PerBigPlanBreakdownItem(
-                    ref_id=big_plans_by_ref_id[k].ref_id,
-                    name=big_plans_by_ref_id[k].name,
-                    actionable_date=big_plans_by_ref_id[k].actionable_date,
-                    summary=self._run_report_for_inbox_tasks_for_big_plan(
-                        schedule, (vx[1] for vx in v)
-                    ),
-                )
-                for (k, v) in groupby(
-                    sorted(
-                        [
-                            (it.big_plan_ref_id, it)
-                            for it in all_inbox_tasks
-                            if it.big_plan_ref_id
-                        ],
-                        key=itemgetter(0),
-                    ),
-                    key=itemgetter(0),
-                )
+            ReportUseCase.PerBigPlanBreakdownItem(
+                ref_id=big_plan.ref_id,
+                name=big_plan.name,
+                actionable_date=big_plan.actionable_date,
+                summary=self._run_report_for_inbox_tasks_for_big_plan(
+                    schedule,
+                    inbox_tasks_by_big_plan_ref_id[big_plan.ref_id],
+                    inbox_task_days,
+                ),
             )
-            if big_plans_by_ref_id[bb.ref_id].archived is False
+            for big_plan in (
+                big_plans_by_ref_id[k] for k in sorted(inbox_tasks_by_big_plan_ref_id)
+            )
+            if big_plan.archived is False
         ]
 
         return ReportUseCase.Result(
@@ -559,95 +757,112 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
         )
 
     @staticmethod
-    def _run_report_for_inbox_tasks(
-        schedule: Schedule, inbox_tasks: Iterable[InboxTask]
-    ) -> "InboxTasksSummary":
-        created_cnt_total = 0
-        created_per_source_cnt: DefaultDict[InboxTaskSource, int] = defaultdict(int)
-        accepted_cnt_total = 0
-        accepted_per_source_cnt: DefaultDict[InboxTaskSource, int] = defaultdict(int)
-        working_cnt_total = 0
-        working_per_source_cnt: DefaultDict[InboxTaskSource, int] = defaultdict(int)
-        done_cnt_total = 0
-        done_per_source_cnt: DefaultDict[InboxTaskSource, int] = defaultdict(int)
-        not_done_cnt_total = 0
-        not_done_per_source_cnt: DefaultDict[InboxTaskSource, int] = defaultdict(int)
+    def _as_set(ref_ids: Optional[Iterable[EntityId]]) -> Optional[Set[EntityId]]:
+        return set(ref_ids) if ref_ids is not None else None
 
+    @staticmethod
+    def _bucket_by_origin(
+        inbox_tasks: Iterable[InboxTask],
+    ) -> Tuple[
+        Dict[EntityId, List[InboxTask]],
+        Dict[EntityId, List[InboxTask]],
+        Dict[EntityId, List[InboxTask]],
+    ]:
+        by_habit: DefaultDict[EntityId, List[InboxTask]] = defaultdict(list)
+        by_chore: DefaultDict[EntityId, List[InboxTask]] = defaultdict(list)
+        by_big_plan: DefaultDict[EntityId, List[InboxTask]] = defaultdict(list)
         for inbox_task in inbox_tasks:
-            if schedule.contains_timestamp(inbox_task.created_time):
-                created_cnt_total += 1
-                created_per_source_cnt[inbox_task.source] += 1
+            if inbox_task.habit_ref_id is not None:
+                by_habit[inbox_task.habit_ref_id].append(inbox_task)
+            if inbox_task.chore_ref_id is not None:
+                by_chore[inbox_task.chore_ref_id].append(inbox_task)
+            if inbox_task.big_plan_ref_id is not None:
+                by_big_plan[inbox_task.big_plan_ref_id].append(inbox_task)
+        return by_habit, by_chore, by_big_plan
 
-            if inbox_task.status.is_accepted and inbox_task.accepted_time is None:
-                raise Exception(f"Invalid state for {inbox_task}")
-
-            if inbox_task.status.is_completed and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.completed_time)
-            ):
-                if inbox_task.status == InboxTaskStatus.DONE:
-                    done_cnt_total += 1
-                    done_per_source_cnt[inbox_task.source] += 1
-                else:
-                    not_done_cnt_total += 1
-                    not_done_per_source_cnt[inbox_task.source] += 1
-            elif inbox_task.status.is_working and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.working_time)
-            ):
-                working_cnt_total += 1
-                working_per_source_cnt[inbox_task.source] += 1
-            elif inbox_task.status.is_accepted and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.accepted_time)
-            ):
-                accepted_cnt_total += 1
-                accepted_per_source_cnt[inbox_task.source] += 1
+    @staticmethod
+    def _run_report_for_inbox_tasks(
+        schedule: Schedule,
+        phase_schedules: List[Schedule],
+        inbox_tasks: Iterable[InboxTask],
+        inbox_task_days: Dict[EntityId, _WorkableDays],
+        project_name_of: Callable[[InboxTask], EntityName],
+    ) -> Tuple[
+        "ReportUseCase.InboxTasksSummary",
+        Dict[EntityName, "ReportUseCase.InboxTasksSummary"],
+        List["ReportUseCase.InboxTasksSummary"],
+    ]:
+        global_summary = _InboxTasksSummaryBuilder()
+        per_project_summary: DefaultDict[
+            EntityName, _InboxTasksSummaryBuilder
+        ] = defaultdict(_InboxTasksSummaryBuilder)
+        per_phase_summary = [_InboxTasksSummaryBuilder() for _ in phase_schedules]
+        # These get called for every event, so they're only looked up once.
+        contains_day = _ScheduleBounds.from_schedule(schedule).contains_day
+        find_phase = _PhaseFinder(phase_schedules).find_phase
 
-        return ReportUseCase.InboxTasksSummary(
-            created=ReportUseCase.NestedResult(
-                total_cnt=created_cnt_total, per_source_cnt=created_per_source_cnt
-            ),
-            accepted=ReportUseCase.NestedResult(
-                total_cnt=accepted_cnt_total, per_source_cnt=accepted_per_source_cnt
-            ),
-            working=ReportUseCase.NestedResult(
-                total_cnt=working_cnt_total, per_source_cnt=working_per_source_cnt
-            ),
-            not_done=ReportUseCase.NestedResult(
-                total_cnt=not_done_cnt_total, per_source_cnt=not_done_per_source_cnt
-            ),
-            done=ReportUseCase.NestedResult(
-                total_cnt=done_cnt_total, per_source_cnt=done_per_source_cnt
-            ),
+        for inbox_task in inbox_tasks:
+            project_summary = per_project_summary[project_name_of(inbox_task)]
+
+            source_idx = _SOURCE_IDX[inbox_task.source]
+            days = inbox_task_days[inbox_task.ref_id]
+            events = [("created", days.created_day)]
+            if days.progress_kind is not None and days.progress_day is not None:
+                events.append((days.progress_kind, days.progress_day))
+
+            for kind, day in events:
+                if contains_day(day):
+                    global_summary.add(kind, source_idx)
+                    project_summary.add(kind, source_idx)
+
+                phase_idx = find_phase(day)
+                if phase_idx is not None:
+                    per_phase_summary[phase_idx].add(kind, source_idx)
+
+        return (
+            global_summary.build(),
+            {k: per_project_summary[k].build() for k in sorted(per_project_summary)},
+            [s.build() for s in per_phase_summary],
         )
 
     @staticmethod
-    def _run_report_for_inbox_tasks_for_big_plan(
-        schedule: Schedule, inbox_tasks: Iterable[InboxTask]
-    ) -> "BigPlanSummary":
-        created_cnt = 0
-        accepted_cnt = 0
-        working_cnt = 0
-        done_cnt = 0
-        not_done_cnt = 0
-
+    def _count_inbox_task_events(
+        schedule_bounds: _ScheduleBounds,
+        inbox_tasks: Iterable[InboxTask],
+        inbox_task_days: Dict[EntityId, _WorkableDays],
+    ) -> DefaultDict[str, int]:
+        event_cnt: DefaultDict[str, int] = defaultdict(int)
+        contains_day = schedule_bounds.contains_day
         for inbox_task in inbox_tasks:
-            if schedule.contains_timestamp(inbox_task.created_time):
-                created_cnt += 1
+            days = inbox_task_days[inbox_task.ref_id]
 
-            if inbox_task.status.is_completed and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.completed_time)
-            ):
-                if inbox_task.status == InboxTaskStatus.DONE:
-                    done_cnt += 1
-                else:
-                    not_done_cnt += 1
-            elif inbox_task.status.is_working and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.working_time)
-            ):
-                working_cnt += 1
-            elif inbox_task.status.is_accepted and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.accepted_time)
+            if contains_day(days.created_day):
+                event_cnt["created"] += 1
+
+            # The status was already resolved into a progress kind, once per task.
+            if (
+                days.progress_kind is not None
+                and days.progress_day is not None
+                and contains_day(days.progress_day)
             ):
-                accepted_cnt += 1
+                event_cnt[days.progress_kind] += 1
+        return event_cnt
+
+    @staticmethod
+    def _run_report_for_inbox_tasks_for_big_plan(
+        schedule: Schedule,
+        inbox_tasks: Iterable[InboxTask],
+        inbox_task_days: Dict[EntityId, _WorkableDays],
+    ) -> "BigPlanSummary":
+        schedule_bounds = _ScheduleBounds.from_schedule(schedule)
+        event_cnt = ReportUseCase._count_inbox_task_events(
+            schedule_bounds, inbox_tasks, inbox_task_days
+        )
+        created_cnt = event_cnt["created"]
+        accepted_cnt = event_cnt["accepted"]
+        working_cnt = event_cnt["working"]
+        done_cnt = event_cnt["done"]
+        not_done_cnt = event_cnt["not_done"]
 
         return ReportUseCase.BigPlanSummary(
             created_cnt=created_cnt,
@@ -663,51 +878,45 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
 
     @staticmethod
     def _run_report_for_inbox_for_recurring_tasks(
-        schedule: Schedule, inbox_tasks: List[InboxTask]
+        schedule: Schedule,
+        inbox_tasks: List[InboxTask],
+        inbox_task_days: Dict[EntityId, _WorkableDays],
     ) -> "RecurringTaskSummary":
+        schedule_bounds = _ScheduleBounds.from_schedule(schedule)
         # The simple summary computations here.
-        created_cnt = 0
-        accepted_cnt = 0
-        working_cnt = 0
-        done_cnt = 0
-        not_done_cnt = 0
-
-        for inbox_task in inbox_tasks:
-            if schedule.contains_timestamp(inbox_task.created_time):
-                created_cnt += 1
-
-            if inbox_task.status.is_completed and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.completed_time)
-            ):
-                if inbox_task.status == InboxTaskStatus.DONE:
-                    done_cnt += 1
-                else:
-                    not_done_cnt += 1
-            elif inbox_task.status.is_working and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.working_time)
-            ):
-                working_cnt += 1
-            elif inbox_task.status.is_accepted and schedule.contains_timestamp(
-                cast(Timestamp, inbox_task.accepted_time)
-            ):
-                accepted_cnt += 1
+        event_cnt = ReportUseCase._count_inbox_task_events(
+            schedule_bounds, inbox_tasks, inbox_task_days
+        )
+        created_cnt = event_cnt["created"]
+        accepted_cnt = event_cnt["accepted"]
+        working_cnt = event_cnt["working"]
+        done_cnt = event_cnt["done"]
+        not_done_cnt = event_cnt["not_done"]
 
         # The streak computations here.
         sorted_inbox_tasks = sorted(
-            (it for it in inbox_tasks if schedule.contains_timestamp(it.created_time)),
-            key=lambda it: (it.created_time, it.recurring_repeat_index),
+            (
+                it
+                for it in inbox_tasks
+                if schedule_bounds.contains_day(inbox_task_days[it.ref_id].created_day)
+            ),
+            # Sorting on the raw datetimes compares them natively, rather than going
+            # through the Timestamp equality and ordering methods on every compare.
+            key=lambda it: (it.created_time.value, it.recurring_repeat_index),
         )
         used_skip_once = False
-        streak_plot = []
+        # Each entry is either a mark, or the count of done tasks in a period with
+        # repeats, which gets bumped in place and only turned into text at the end.
+        streak_plot: List[Tuple[str, int]] = []
 
         for inbox_task_idx, inbox_task in enumerate(sorted_inbox_tasks):
             if inbox_task.status == InboxTaskStatus.DONE:
                 if inbox_task.recurring_repeat_index is None:
-                    streak_plot.append("X")
+                    streak_plot.append(("X", 0))
                 elif inbox_task.recurring_repeat_index == 0:
-                    streak_plot.append("1")
+                    streak_plot.append(("", 1))
                 else:
-                    streak_plot[-1] = str(int(streak_plot[-1], base=10) + 1)
+                    streak_plot[-1] = ("", streak_plot[-1][1] + 1)
             else:
                 if (
                     inbox_task_idx != 0
@@ -720,24 +929,24 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
                 ):
                     used_skip_once = True
                     if inbox_task.recurring_repeat_index is None:
-                        streak_plot.append("x")
+                        streak_plot.append(("x", 0))
                     elif inbox_task.recurring_repeat_index == 0:
-                        streak_plot.append("1")
+                        streak_plot.append(("", 1))
                     else:
-                        streak_plot[-1] = str(int(streak_plot[-1], base=10) + 1)
+                        streak_plot[-1] = ("", streak_plot[-1][1] + 1)
                 else:
                     used_skip_once = False
                     if inbox_task.recurring_repeat_index is None:
                         streak_plot.append(
-                            "."
+                            (".", 0)
                             if inbox_task_idx < (len(sorted_inbox_tasks) - 1)
-                            else "?"
+                            else ("?", 0)
                         )
                     elif inbox_task.recurring_repeat_index == 0:
                         streak_plot.append(
-                            "0"
+                            ("", 0)
                             if inbox_task_idx < (len(sorted_inbox_tasks) - 1)
-                            else "?"
+                            else ("?", 0)
                         )
 
         return ReportUseCase.RecurringTaskSummary(
@@ -750,61 +959,48 @@ class ReportUseCase(AppReadonlyUseCase["ReportUseCase.Args", "ReportUseCase.Resu
             else 0.0,
             done_cnt=done_cnt,
             done_ratio=done_cnt / float(created_cnt) if created_cnt > 0 else 0.0,
-            streak_plot="".join(streak_plot),
+            streak_plot="".join(mark or str(cnt) for (mark, cnt) in streak_plot),
         )
 
     @staticmethod
-    def _run_report_for_big_plan(
-        schedule: Schedule, big_plans: Iterable[BigPlan]
-    ) -> "WorkableSummary":
-        created_cnt = 0
-        accepted_cnt = 0
-        working_cnt = 0
-        not_done_cnt = 0
-        done_cnt = 0
-        not_done_projects = []
-        done_projects = []
+    def _run_report_for_big_plans(
+        schedule: Schedule,
+        phase_schedules: List[Schedule],
+        big_plans: Iterable[BigPlan],
+        big_plan_days: Dict[EntityId, _WorkableDays],
+        project_name_of: Callable[[BigPlan], EntityName],
+    ) -> Tuple[
+        "ReportUseCase.WorkableSummary",
+        Dict[EntityName, "ReportUseCase.WorkableSummary"],
+        List["ReportUseCase.WorkableSummary"],
+    ]:
+        global_summary = _BigPlansSummaryBuilder()
+        per_project_summary: DefaultDict[
+            EntityName, _BigPlansSummaryBuilder
+        ] = defaultdict(_BigPlansSummaryBuilder)
+        per_phase_summary = [_BigPlansSummaryBuilder() for _ in phase_schedules]
+        contains_day = _ScheduleBounds.from_schedule(schedule).contains_day
+        find_phase = _PhaseFinder(phase_schedules).find_phase
 
         for big_plan in big_plans:
-            if schedule.contains_timestamp(big_plan.created_time):
-                created_cnt += 1
-
-            if big_plan.status.is_completed and schedule.contains_timestamp(
-                cast(Timestamp, big_plan.completed_time)
-            ):
-                if big_plan.status == BigPlanStatus.DONE:
-                    done_cnt += 1
-                    done_projects.append(
-                        ReportUseCase.WorkableBigPlan(
-                            ref_id=big_plan.ref_id,
-                            name=big_plan.name,
-                            actionable_date=big_plan.actionable_date,
-                        )
-                    )
-                else:
-                    not_done_cnt += 1
-                    not_done_projects.append(
-                        ReportUseCase.WorkableBigPlan(
-                            ref_id=big_plan.ref_id,
-                            name=big_plan.name,
-                            actionable_date=big_plan.actionable_date,
-                        )
-                    )
-            elif big_plan.status.is_working and schedule.contains_timestamp(
-                cast(Timestamp, big_plan.working_time)
-            ):
-                working_cnt += 1
-            elif big_plan.status.is_accepted and schedule.contains_timestamp(
-                cast(Timestamp, big_plan.accepted_time)
-            ):
-                accepted_cnt += 1
-
-        return ReportUseCase.WorkableSummary(
-            created_cnt=created_cnt,
-            accepted_cnt=accepted_cnt,
-            working_cnt=working_cnt,
-            done_cnt=done_cnt,
-            not_done_cnt=not_done_cnt,
-            not_done_big_plans=not_done_projects,
-            done_big_plans=done_projects,
+            project_summary = per_project_summary[project_name_of(big_plan)]
+
+            days = big_plan_days[big_plan.ref_id]
+            events = [("created", days.created_day)]
+            if days.progress_kind is not None and days.progress_day is not None:
+                events.append((days.progress_kind, days.progress_day))
+
+            for kind, day in events:
+                if contains_day(day):
+                    global_summary.add(kind, big_plan)
+                    project_summary.add(kind, big_plan)
+
+                phase_idx = find_phase(day)
+                if phase_idx is not None:
+                    per_phase_summary[phase_idx].add(kind, big_plan)
+
+        return (
+            global_summary.build(),
+            {k: v.build() for (k, v) in per_project_summary.items()},
+            [s.build() for s in per_phase_summary],
         )
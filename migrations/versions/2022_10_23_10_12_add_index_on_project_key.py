@@ -0,0 +1,23 @@
+"""Add index on project key
+
+Revision ID: 0b7ebd27f34f
+Revises: d25373054629
+Create Date: 2022-10-23 10:12:41.302117
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0b7ebd27f34f'
+down_revision = 'd25373054629'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE INDEX ix_project_project_collection_ref_id_the_key ON project (project_collection_ref_id, the_key);""")
+
+
+def downgrade():
+    op.execute("""DROP INDEX ix_project_project_collection_ref_id_the_key""")
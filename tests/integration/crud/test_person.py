@@ -186,3 +186,100 @@ class PersonIntegrationTestCase(JupiterIntegrationTestCase):
         )
 
         assert notion_row.attributes["Project"] == "Personal"
+
+    def test_person_change_catch_up_project_moves_existing_tasks(self) -> None:
+        """Changing the catch up project moves the existing persons tasks."""
+        self.jupiter_create(
+            "person-create",
+            "--name",
+            "Mike",
+            "--relationship",
+            "friend",
+            "--catch-up-period",
+            "weekly",
+            "--birthday",
+            "20 Apr",
+        )
+        self.jupiter(
+            "gen",
+            "--date",
+            "2022-05-18",
+            "--period",
+            "weekly",
+            "--period",
+            "yearly",
+            "--target",
+            "persons",
+        )
+
+        self.jupiter("person-change-catch-up-project", "--catch-up-project", "personal")
+
+        self.go_to_notion("My Work", "Inbox Tasks")
+
+        notion_row = self.get_notion_row(
+            "Catch up with Mike",
+            ["Project"],
+        )
+
+        assert notion_row.attributes["Project"] == "Personal"
+        assert not self.check_notion_row_exists("Catch up with Catch up with Mike")
+
+        inbox_task_out = self.jupiter("inbox-task-show", "--project", "personal")
+
+        assert re.search(r"Catch up with Mike", inbox_task_out)
+        assert re.search(r"Wish happy birthday to Mike", inbox_task_out)
+        assert not re.search(r"Catch up with Catch up with", inbox_task_out)
+        assert not re.search(
+            r"Wish happy birthday to Wish happy birthday to", inbox_task_out
+        )
+        assert re.search(r"Due at 2022-05-22", inbox_task_out)
+        assert re.search(r"Due at 2022-04-20", inbox_task_out)
+
+    def test_person_change_catch_up_project_moves_archived_tasks(self) -> None:
+        """Changing the catch up project moves tasks of persons without catch ups."""
+        person_id = self.jupiter_create(
+            "person-create",
+            "--name",
+            "Mike",
+            "--relationship",
+            "friend",
+            "--catch-up-period",
+            "weekly",
+            "--birthday",
+            "20 Apr",
+            hint="Mike",
+        )
+        self.jupiter(
+            "gen",
+            "--date",
+            "2022-05-18",
+            "--period",
+            "weekly",
+            "--period",
+            "yearly",
+            "--target",
+            "persons",
+        )
+        self.jupiter(
+            "person-update",
+            "--id",
+            person_id,
+            "--clear-catch-up-period",
+            "--clear-birthday",
+        )
+
+        self.jupiter("person-change-catch-up-project", "--catch-up-project", "personal")
+
+        inbox_task_out = self.jupiter(
+            "inbox-task-show", "--show-archived", "--project", "personal"
+        )
+
+        assert re.search(r"Catch up with Mike", inbox_task_out)
+        assert re.search(r"Wish happy birthday to Mike", inbox_task_out)
+        assert not re.search(r"Catch up with Catch up with", inbox_task_out)
+        assert not re.search(
+            r"Wish happy birthday to Wish happy birthday to", inbox_task_out
+        )
+        assert re.search(r"Due at 2022-05-22", inbox_task_out)
+        assert re.search(r"Due at 2022-04-20", inbox_task_out)
+        assert not re.search(r"Due at 2022-12-31", inbox_task_out)